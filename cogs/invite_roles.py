@@ -1,7 +1,9 @@
 # cogs/invite_roles.py
+import asyncio
 import os
 import re
-from typing import Dict, Optional
+import time
+from typing import Dict, Optional, Tuple
 
 import discord
 from discord.ext import commands
@@ -31,6 +33,11 @@ DM_OPTIN_RR_CHANNEL_ID = int(os.getenv("DM_OPTIN_RR_CHANNEL_ID", "0"))
 DM_OPTIN_RR_MESSAGE_ID = int(os.getenv("DM_OPTIN_RR_MESSAGE_ID", "0"))
 DM_OPTIN_RR_EMOJI = (os.getenv("DM_OPTIN_RR_EMOJI", "") or "").strip()
 
+# ---- Invite fetch coalescing -----------------------------------------------
+
+# Joins arriving within this window share one guild.invites() fetch
+INVITE_FETCH_COALESCE_SECONDS = 2.0
+
 
 def _emoji_matches_config(payload_emoji: discord.PartialEmoji) -> bool:
     """Return True if the event's emoji matches ECL_RR_EMOJI."""
@@ -72,8 +79,13 @@ class InviteRoles(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        # guild_id -> { invite_code: {"uses": int, "max_uses": int} }
-        self.invite_cache: Dict[int, Dict[str, Dict[str, int]]] = {}
+        # guild_id -> { invite_code: (uses, max_uses) }  (max_uses 0 = infinite)
+        self.invite_cache: Dict[int, Dict[str, Tuple[int, int]]] = {}
+
+        # Join-path fetch coalescing: one guild.invites() per burst of joins
+        self._invite_fetch_locks: Dict[int, asyncio.Lock] = {}
+        self._invite_fetch_ts: Dict[int, float] = {}
+        self._invite_fetch_snapshot: Dict[int, Dict[str, Tuple[int, int]]] = {}
 
     # ---------------------- Invite cache utilities ---------------------------
 
@@ -81,81 +93,101 @@ class InviteRoles(commands.Cog):
         """Fetch current invites and store them in memory."""
         invites = await guild.invites()
         self.invite_cache[guild.id] = {
-            inv.code: {
-                "uses": inv.uses or 0,
-                "max_uses": inv.max_uses or 0,  # 0 = infinite
-            }
+            inv.code: (inv.uses or 0, inv.max_uses or 0)  # max_uses 0 = infinite
             for inv in invites
         }
         log_sync(f"[invite_roles] cached {len(invites)} invites for {guild.name}")
 
     @commands.Cog.listener()
     async def on_invite_create(self, invite: discord.Invite):
-        """Whenever a new invite is created, refresh the cache for that guild."""
+        """Whenever a new invite is created, add it to the cache for that guild."""
         guild = invite.guild
         if guild is None:
             return
-        await self.build_invite_cache(guild)
+        if guild.id not in self.invite_cache:
+            await self.build_invite_cache(guild)
+            return
+        self.invite_cache[guild.id][invite.code] = (invite.uses or 0, invite.max_uses or 0)
 
     # ---------------------- On member join: detect invite --------------------
 
-    @commands.Cog.listener()
-    async def on_member_join(self, member: discord.Member):
-        guild = member.guild
-        if GUILD_ID and guild.id != GUILD_ID:
-            return
-
-        cached = self.invite_cache.get(guild.id, {})
+    async def _fetch_invites_for_join(
+        self, guild: discord.Guild, *, joined_at: float
+    ) -> Dict[str, Tuple[int, int]]:
+        """Return current invite uses; caller must hold the guild's fetch lock.
+
+        A fetch that *started* after this join arrived (and is still recent)
+        already reflects its use, so concurrent joins reuse it instead of
+        each calling guild.invites(). The first of them consumes the whole
+        diff (see on_member_join), so the rest are left unattributed.
+        """
+        fetched_at = self._invite_fetch_ts.get(guild.id, 0.0)
+        if (
+            fetched_at >= joined_at
+            and time.monotonic() - fetched_at < INVITE_FETCH_COALESCE_SECONDS
+            and guild.id in self._invite_fetch_snapshot
+        ):
+            return self._invite_fetch_snapshot[guild.id]
+
+        fetched_at = time.monotonic()
         current_invites = await guild.invites()
-
         current = {
-            inv.code: {
-                "uses": inv.uses or 0,
-                "max_uses": inv.max_uses or 0,  # 0 means unlimited
-            }
+            inv.code: (inv.uses or 0, inv.max_uses or 0)  # max_uses 0 means unlimited
             for inv in current_invites
         }
+        self._invite_fetch_ts[guild.id] = fetched_at
+        self._invite_fetch_snapshot[guild.id] = current
+        return current
 
-        used_code: Optional[str] = None
-        before: Optional[Dict[str, int]] = None
-        after: Optional[Dict[str, int]] = None
-
-        # 1) Find invite whose uses increased
-        for code, data in current.items():
-            prev = cached.get(code)
-            if prev and data["uses"] > prev["uses"]:
-                used_code, before, after = code, prev, data
-                break
-
-        # 2) If none increased, check if an invite disappeared (likely 1-use consumed)
-        if used_code is None:
-            for old_code, old_data in cached.items():
-                if old_code not in current:
-                    used_code, before, after = old_code, old_data, None
-                    break
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        guild = member.guild
+        if GUILD_ID and guild.id != GUILD_ID:
+            return
 
-        # Update cache right away
-        self.invite_cache[guild.id] = current
+        joined_at = time.monotonic()
+        lock = self._invite_fetch_locks.setdefault(guild.id, asyncio.Lock())
+        async with lock:
+            cached = self.invite_cache.get(guild.id, {})
+            current = await self._fetch_invites_for_join(guild, joined_at=joined_at)
+
+            used_code: Optional[str] = None
+            before: Optional[Tuple[int, int]] = None
+            after: Optional[Tuple[int, int]] = None
+
+            # Invites whose uses increased, then invites that disappeared (likely 1-use consumed)
+            changed = [
+                (code, prev, current[code])
+                for code, prev in cached.items()
+                if code in current and current[code][0] > prev[0]
+            ]
+            changed += [(code, prev, None) for code, prev in cached.items() if code not in current]
+
+            if len(changed) == 1:
+                used_code, before, after = changed[0]
+            elif changed:
+                # Several joins landed in one (shared) fetch: we can't tell whose invite is whose
+                log_warn(
+                    f"[invite_roles] {member} joined; {len(changed)} invites changed at once "
+                    f"({', '.join(c[0] for c in changed)}), skipping attribution"
+                )
+
+            # Consume every diff so no later join inherits an unclaimed one
+            self.invite_cache[guild.id] = current
 
         log_sync(f"[invite_roles] {member} joined. used={used_code} before={before} after={after}")
 
         # Rule: any invite with max_uses == 1 counts as PT
         is_pt = False
         if used_code:
-            if after is None and before and before.get("max_uses") == 1:
+            if after is None and before and before[1] == 1:
                 is_pt = True
-            elif (after and after.get("max_uses") == 1) or (
-                before and before.get("max_uses") == 1
-            ):
+            elif (after and after[1] == 1) or (before and before[1] == 1):
                 is_pt = True
-            elif after and after.get("max_uses", 0) > 0:
+            elif after and after[1] > 0:
                 # Handle odd edge: we hit max uses exactly on this join
-                if (
-                    before
-                    and after["uses"] >= after["max_uses"]
-                    and after["uses"] > before["uses"]
-                ):
-                    is_pt = (after["max_uses"] == 1) or (before.get("max_uses") == 1)
+                if before and after[0] >= after[1] and after[0] > before[0]:
+                    is_pt = (after[1] == 1) or (before[1] == 1)
 
         if is_pt:
             pt_role = guild.get_role(PT_ROLE_ID)
@@ -38,6 +38,13 @@ from utils.settings import env_int as _env_int, parse_int_set as _parse_int_set
 
 # -------------------- config --------------------
 
+_GUILD_ID = _env_int("GUILD_ID", 0)
+_ECL_ROLE_ID = _env_int("ECL_ROLE", 0)
+_JOIN_LEAGUE_CHANNEL_ID = _env_int("JOIN_LEAGUE_CHANNEL_ID", 0)
+_RULES_CHANNEL_ID = _env_int("RULES_CHANNEL_ID", 0)
+_GET_STARTED_CHANNEL_ID = _env_int("GET_STARTED_CHANNEL_ID", 0)
+
+
 @dataclass(frozen=True)
 class JoinLeagueConfig:
     guild_id: int
@@ -58,10 +65,10 @@ class JoinLeagueConfig:
 
 
 def load_config() -> JoinLeagueConfig:
-    guild_id = _env_int("GUILD_ID", 0)
-    ecl_role_id = _env_int("ECL_ROLE", 0)
+    guild_id = _GUILD_ID
+    ecl_role_id = _ECL_ROLE_ID
 
-    join_channel_id = _env_int("JOIN_LEAGUE_CHANNEL_ID", 0)
+    join_channel_id = _JOIN_LEAGUE_CHANNEL_ID
 
     patreon_role_ids = _parse_int_set(os.getenv("PATREON_ROLE_IDS", ""))
     kofi_role_ids = _parse_int_set(os.getenv("KOFI_ROLE_IDS", ""))
@@ -80,8 +87,8 @@ def load_config() -> JoinLeagueConfig:
         target_month = month_key(now)
 
 
-    rules_channel_id = _env_int("RULES_CHANNEL_ID", 0)
-    get_started_channel_id = _env_int("GET_STARTED_CHANNEL_ID", 0)
+    rules_channel_id = _RULES_CHANNEL_ID
+    get_started_channel_id = _GET_STARTED_CHANNEL_ID
 
     return JoinLeagueConfig(
         guild_id=guild_id,
@@ -243,7 +250,7 @@ class JoinLeagueCog(commands.Cog):
         cfg = self.cfg
 
         if not interaction.guild or not isinstance(interaction.user, discord.Member):
-            with contextlib.suppress(Exception):
+            with contextlib.suppress(discord.HTTPException):
                 await interaction.response.send_message("This button only works inside the server.", ephemeral=True)
             return
 
@@ -251,7 +258,7 @@ class JoinLeagueCog(commands.Cog):
         guild = interaction.guild
 
         if cfg.guild_id and guild.id != cfg.guild_id:
-            with contextlib.suppress(Exception):
+            with contextlib.suppress(discord.HTTPException):
                 await interaction.response.send_message("Wrong server.", ephemeral=True)
             return
 
@@ -270,7 +277,7 @@ class JoinLeagueCog(commands.Cog):
                 "If you just subscribed, make sure your Discord account is linked/synced on **Ko-fi/Patreon**, "
                 "wait a moment for roles to appear, then click **Enter League** again."
             )
-            with contextlib.suppress(Exception):
+            with contextlib.suppress(discord.HTTPException):
                 await interaction.response.send_message(msg, ephemeral=True, view=view)
             return
 
@@ -287,17 +294,17 @@ class JoinLeagueCog(commands.Cog):
         if not already_welcomed:
             rules = self._rules_mention(guild)
             get_started = self._get_started_mention(guild)
-            try:
+            # Any send failure (closed DMs included) just means no DM this time.
+            with contextlib.suppress(Exception):
                 await member.send(
                     "✅ You're in!\n\n"
                     f"Please read {rules} and {get_started} before playing. 🐸"
                 )
                 sent_dm = True
-                # Record the once-marker only after a successful send.
+            # Record the once-marker only after a successful send.
+            if sent_dm:
                 with contextlib.suppress(Exception):
                     await subs_jobs.insert_one({"_id": job_id, "ran_at": datetime.now(timezone.utc)})
-            except Exception:
-                sent_dm = False
 
         # Ephemeral confirmation
         if added:
@@ -305,7 +312,7 @@ class JoinLeagueCog(commands.Cog):
         else:
             text = f"✅ You're already in.{' Check your DMs.' if sent_dm else ''}"
 
-        with contextlib.suppress(Exception):
+        with contextlib.suppress(discord.HTTPException):
             await interaction.response.send_message(text, ephemeral=True)
 
     # -------------------- embed posting --------------------
@@ -371,7 +378,7 @@ class JoinLeagueCog(commands.Cog):
     @commands.slash_command(
         name="joinpost",
         description="Post the #join-... embeds (links + Enter button) in this channel.",
-        guild_ids=[_env_int("GUILD_ID", 0)] if _env_int("GUILD_ID", 0) else None,
+        guild_ids=[_GUILD_ID] if _GUILD_ID else None,
     )
     async def joinpost(self, ctx: discord.ApplicationContext):
         if not ctx.user.guild_permissions.manage_roles:
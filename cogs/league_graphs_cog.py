@@ -10,13 +10,17 @@ Chart types:
 from __future__ import annotations
 
 import asyncio
-from typing import List, Optional, Tuple
+from collections import OrderedDict
+from datetime import datetime
+from io import BytesIO
+from typing import Any, Dict, Optional, Tuple
 
 import discord
+import numpy as np
 from discord.ext import commands
 from discord import Option
 
-from topdeck_fetch import PlayerRow, get_league_rows_cached
+from topdeck_fetch import get_league_rows_cached
 from utils.interactions import safe_ctx_defer, safe_ctx_followup
 from utils.settings import GUILD_ID, SUBS, FIREBASE_ID_TOKEN
 from utils.monthly_config import get_bracket_id
@@ -57,6 +61,37 @@ LEAGUE_CHART_CHOICES = [
     discord.OptionChoice("All-Time Avg Games by Day", "daily_avg_alltime"),
 ]
 
+# Rendered PNG + embed per (chart, month, bracket). Entries are only reused
+# while the TopDeck fetch they were rendered from is still the cached one
+# (rows and matches share the same fetched_at), so a refresh invalidates them.
+_CHART_CACHE_MAX = 16
+_CHART_CACHE_CHARTS = {"league_activity", "standings", "points_dist", "games_dist"}
+_CHART_CACHE: OrderedDict[
+    Tuple[str, str, str], Tuple[datetime, bytes, str, Dict[str, Any]]
+] = OrderedDict()
+
+# Shared styling for every /leaguegraphs embed; helpers only add title/description.
+_EMBED_TEMPLATE: Dict[str, Any] = {
+    "type": "rich",
+    "color": int(getattr(SUBS, "embed_color", 0x2ECC71) or 0x2ECC71),
+}
+_thumb_url = getattr(SUBS, "embed_thumbnail_url", "") or ""
+if _thumb_url.startswith(("http://", "https://")):
+    _EMBED_TEMPLATE["thumbnail"] = {"url": _thumb_url}
+
+
+def _league_embed(**fields: Any) -> discord.Embed:
+    """Build an embed from the shared template plus per-chart fields."""
+    return discord.Embed.from_dict({**_EMBED_TEMPLATE, **fields})
+
+
+# Column arrays built from the cached league rows, keyed by (bracket_id, token)
+# and reused while the TopDeck fetched_at is unchanged.
+_ROW_COLUMNS_CACHE: Dict[Tuple[str, str], Tuple[datetime, Dict[str, np.ndarray]]] = {}
+
+# (bracket_id, month_key) -> (fetched_at, daily activity array, total games, active days)
+_MONTH_AGG_CACHE: Dict[Tuple[str, str], Tuple[datetime, np.ndarray, int, int]] = {}
+
 
 class LeagueGraphsCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
@@ -100,8 +135,23 @@ class LeagueGraphsCog(commands.Cog):
 
         log_sync(f"[leaguegraphs] chart={chart}")
 
+        cache_key = (chart, mk, bracket_id)
+        version: Optional[datetime] = None
+        cache_hit = False
+
         try:
-            if chart == "league_activity":
+            if chart in _CHART_CACHE_CHARTS:
+                # Warms the shared TopDeck cache; fetched_at doubles as the data version
+                _, version = await get_league_rows_cached(bracket_id, FIREBASE_ID_TOKEN)
+
+            cached = _CHART_CACHE.get(cache_key) if version is not None else None
+            if cached is not None and cached[0] == version:
+                cache_hit = True
+                _CHART_CACHE.move_to_end(cache_key)
+                _, png, filename, emb_data = cached
+                buf = BytesIO(png)
+                emb = discord.Embed.from_dict(emb_data)
+            elif chart == "league_activity":
                 buf, filename, emb = await self._chart_league_activity(mk, ml, bracket_id)
             elif chart == "standings":
                 buf, filename, emb = await self._chart_standings(ml, bracket_id)
@@ -124,6 +174,12 @@ class LeagueGraphsCog(commands.Cog):
             else:
                 await safe_ctx_followup(ctx, "Unknown chart type.", ephemeral=True)
                 return
+
+            if version is not None and not cache_hit:
+                _CHART_CACHE[cache_key] = (version, buf.getvalue(), filename, emb.to_dict())
+                _CHART_CACHE.move_to_end(cache_key)
+                while len(_CHART_CACHE) > _CHART_CACHE_MAX:
+                    _CHART_CACHE.popitem(last=False)
         except Exception as e:
             log_warn(f"[leaguegraphs] Error generating chart={chart}: "
                      f"{type(e).__name__}: {e}")
@@ -135,11 +191,6 @@ class LeagueGraphsCog(commands.Cog):
             return
 
         emb.set_image(url=f"attachment://{filename}")
-        emb.color = int(getattr(SUBS, "embed_color", 0x2ECC71) or 0x2ECC71)
-
-        thumb_url = getattr(SUBS, "embed_thumbnail_url", "") or ""
-        if thumb_url.startswith(("http://", "https://")):
-            emb.set_thumbnail(url=thumb_url)
 
         footer_label = "All Time" if chart.endswith("_alltime") else mk
         emb.set_footer(text=f"ECL \u2022 {footer_label} \u2022 /leaguegraphs")
@@ -150,40 +201,78 @@ class LeagueGraphsCog(commands.Cog):
     # Helpers
     # ------------------------------------------------------------------
 
-    async def _fetch_rows(self, bracket_id: str) -> List[PlayerRow]:
-        """Fetch league rows, raise on failure."""
-        rows, _ = await get_league_rows_cached(bracket_id, FIREBASE_ID_TOKEN)
+    async def _fetch_columns(self, bracket_id: str) -> Dict[str, np.ndarray]:
+        """Fetch active (games > 0) league rows as NumPy columns (name, pts, ow, wp, games)."""
+        rows, fetched_at = await get_league_rows_cached(
+            bracket_id, FIREBASE_ID_TOKEN, active_only=True
+        )
         if not rows:
-            raise ValueError("No league data available.")
-        return rows
+            raise ValueError("No players with games found.")
+
+        key = (bracket_id, FIREBASE_ID_TOKEN or "")
+        cached = _ROW_COLUMNS_CACHE.get(key)
+        if cached is not None and cached[0] == fetched_at:
+            return cached[1]
+
+        n = len(rows)
+        cols = {
+            "name": np.empty(n, dtype=object),
+            "pts": np.empty(n, dtype=np.float64),
+            "ow": np.empty(n, dtype=np.float64),
+            "wp": np.empty(n, dtype=np.float64),
+            "games": np.empty(n, dtype=np.int64),
+        }
+        # PlayerRow fields are always populated (float()/int() at construction)
+        for i, r in enumerate(rows):
+            cols["name"][i] = r.name
+            cols["pts"][i] = r.pts
+            cols["ow"][i] = r.ow_pct
+            cols["wp"][i] = r.win_pct
+            cols["games"][i] = r.games
+
+        _ROW_COLUMNS_CACHE[key] = (fetched_at, cols)
+        return cols
 
     # ------------------------------------------------------------------
     # Chart: League Activity (stacked bar)
     # ------------------------------------------------------------------
 
-    async def _chart_league_activity(self, mk, ml, bracket_id):
+    async def _month_daily_activity(self, mk, bracket_id) -> Tuple[np.ndarray, int, int]:
+        """(daily array, total games, active days) for the month, cached per TopDeck fetch."""
+        # Rows and matches are cached together, so fetched_at versions both
+        _, version = await get_league_rows_cached(bracket_id, FIREBASE_ID_TOKEN)
+        key = (bracket_id, mk)
+        cached = _MONTH_AGG_CACHE.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1], cached[2], cached[3]
+
         matches, entrant_to_uid = await get_live_matches(bracket_id, FIREBASE_ID_TOKEN)
         log_sync(f"[leaguegraphs] league_activity: got {len(matches)} total matches from live data")
         month_matches, _, _ = _get_current_month_matches(matches, entrant_to_uid)
         log_sync(f"[leaguegraphs] league_activity: filtered to {len(month_matches)} for current month ({mk})")
 
         daily = get_league_daily_activity(month_matches)
+        # Each game is counted once as a win or a draw, so the column sum is games per day
+        day_totals = daily[:, 1:].sum(axis=0)
+        total = int(day_totals.sum())
+        active_days = int(np.count_nonzero(day_totals))
 
-        if not daily:
+        _MONTH_AGG_CACHE[key] = (version, daily, total, active_days)
+        return daily, total, active_days
+
+    async def _chart_league_activity(self, mk, ml, bracket_id):
+        daily, total, active_days = await self._month_daily_activity(mk, bracket_id)
+        max_day = daily.shape[1] - 1
+
+        if max_day < 1:
             raise ValueError("No completed games found for this month yet.")
 
-        max_day = max(daily.keys())
         days = list(range(1, max_day + 1))
-        wins = [daily.get(d, {}).get("wins", 0) for d in days]
-        losses = [daily.get(d, {}).get("losses", 0) for d in days]
-        draws = [daily.get(d, {}).get("draws", 0) for d in days]
+        wins, losses, draws = daily[0, 1:], daily[1, 1:], daily[2, 1:]
 
         buf = await asyncio.to_thread(render_league_activity, days, wins, losses, draws, ml)
 
-        total = sum(wins) + sum(draws)
-        active_days = sum(1 for d in days if (daily.get(d, {}).get("wins", 0)
-                                               + daily.get(d, {}).get("draws", 0)) > 0)
-        emb = discord.Embed(title=f"\U0001f4c5 League Activity \u2014 {ml}")
+        emb = _league_embed(title=f"\U0001f4c5 League Activity \u2014 {ml}")
         emb.description = f"**{total}** games across **{active_days}** active days"
         return buf, "league_activity.png", emb
 
@@ -192,30 +281,33 @@ class LeagueGraphsCog(commands.Cog):
     # ------------------------------------------------------------------
 
     async def _chart_standings(self, ml, bracket_id):
-        rows = await self._fetch_rows(bracket_id)
-
-        # Sort by points descending, take top 16 with games > 0
-        ranked = sorted(
-            [r for r in rows if int(getattr(r, "games", 0) or 0) > 0],
-            key=lambda r: (
-                -float(getattr(r, "pts", 0.0) or 0.0),
-                -float(getattr(r, "ow_pct", 0.0) or 0.0),
-                -float(getattr(r, "win_pct", 0.0) or 0.0),
-            ),
-        )
-        top = ranked[:16]
-
-        if not top:
+        cols = await self._fetch_columns(bracket_id)
+
+        # Sort by points descending (then OW%, win%), take top 16 with games > 0
+        top_n = 16
+        pts = cols["pts"]
+
+        # Partition down to everyone tied with or above the 16th-best points,
+        # then run the full tie-break sort on that small slice only.
+        if pts.size > top_n:
+            cutoff = np.partition(pts, pts.size - top_n)[pts.size - top_n]
+            sel = np.flatnonzero(pts >= cutoff)
+        else:
+            sel = np.arange(pts.size)
+        sel_order = np.lexsort((-cols["wp"][sel], -cols["ow"][sel], -pts[sel]))
+        order = sel[sel_order][:top_n]
+
+        if order.size == 0:
             raise ValueError("No players with games found.")
 
-        names = [getattr(r, "name", "?") for r in top]
-        points = [float(getattr(r, "pts", 0.0) or 0.0) for r in top]
+        names = cols["name"][order].tolist()
+        points = pts[order].tolist()
 
         buf = await asyncio.to_thread(render_league_standings, names, points, ml)
 
-        emb = discord.Embed(title=f"\U0001f3c6 Standings \u2014 Top {len(top)}")
+        emb = _league_embed(title=f"\U0001f3c6 Standings \u2014 Top {len(names)}")
         emb.description = (
-            f"Top {len(top)} players by points \u2014 {ml}\n"
+            f"Top {len(names)} players by points \u2014 {ml}\n"
             f"Leader: **{names[0]}** ({points[0]:.0f} pts)"
         )
         return buf, "league_standings.png", emb
@@ -225,26 +317,21 @@ class LeagueGraphsCog(commands.Cog):
     # ------------------------------------------------------------------
 
     async def _chart_points_distribution(self, ml, bracket_id):
-        rows = await self._fetch_rows(bracket_id)
+        cols = await self._fetch_columns(bracket_id)
 
         # Include all players with games
-        pts_list = [
-            float(getattr(r, "pts", 0.0) or 0.0)
-            for r in rows
-            if int(getattr(r, "games", 0) or 0) > 0
-        ]
+        pts = cols["pts"]
 
-        if not pts_list:
+        if pts.size == 0:
             raise ValueError("No players with games found.")
 
-        buf = await asyncio.to_thread(render_league_points_distribution, pts_list, ml)
+        buf = await asyncio.to_thread(render_league_points_distribution, pts.tolist(), ml)
 
-        emb = discord.Embed(title=f"\U0001f4ca Points Distribution \u2014 {ml}")
-        avg_pts = sum(pts_list) / len(pts_list)
+        emb = _league_embed(title=f"\U0001f4ca Points Distribution \u2014 {ml}")
         emb.description = (
-            f"**{len(pts_list)}** players \u2022 "
-            f"Avg: **{avg_pts:.0f}** pts \u2022 "
-            f"Range: **{min(pts_list):.0f}** \u2013 **{max(pts_list):.0f}**"
+            f"**{pts.size}** players \u2022 "
+            f"Avg: **{pts.mean():.0f}** pts \u2022 "
+            f"Range: **{pts.min():.0f}** \u2013 **{pts.max():.0f}**"
         )
         return buf, "points_distribution.png", emb
 
@@ -253,25 +340,20 @@ class LeagueGraphsCog(commands.Cog):
     # ------------------------------------------------------------------
 
     async def _chart_games_distribution(self, ml, bracket_id):
-        rows = await self._fetch_rows(bracket_id)
+        cols = await self._fetch_columns(bracket_id)
 
-        games_list = [
-            int(getattr(r, "games", 0) or 0)
-            for r in rows
-            if int(getattr(r, "games", 0) or 0) > 0
-        ]
+        games = cols["games"]
 
-        if not games_list:
+        if games.size == 0:
             raise ValueError("No players with games found.")
 
-        buf = await asyncio.to_thread(render_league_games_distribution, games_list, ml)
+        buf = await asyncio.to_thread(render_league_games_distribution, games.tolist(), ml)
 
-        emb = discord.Embed(title=f"\U0001f3ae Games Distribution \u2014 {ml}")
-        avg_games = sum(games_list) / len(games_list)
+        emb = _league_embed(title=f"\U0001f3ae Games Distribution \u2014 {ml}")
         emb.description = (
-            f"**{len(games_list)}** players \u2022 "
-            f"Avg: **{avg_games:.1f}** games \u2022 "
-            f"Range: **{min(games_list)}** \u2013 **{max(games_list)}**"
+            f"**{games.size}** players \u2022 "
+            f"Avg: **{games.mean():.1f}** games \u2022 "
+            f"Range: **{games.min()}** \u2013 **{games.max()}**"
         )
         return buf, "games_distribution.png", emb
 
@@ -304,7 +386,7 @@ class LeagueGraphsCog(commands.Cog):
         buf = await asyncio.to_thread(render_league_activity_alltime, month_labels, games)
 
         total = sum(games)
-        emb = discord.Embed(title="\U0001f4c8 League Activity \u2014 All Time")
+        emb = _league_embed(title="\U0001f4c8 League Activity \u2014 All Time")
         emb.description = (
             f"**{total}** total games across **{len(aggs)}** months\n"
             f"Peak: **{max(games)}** games ({month_labels[games.index(max(games))]})"
@@ -324,7 +406,7 @@ class LeagueGraphsCog(commands.Cog):
 
         buf = await asyncio.to_thread(render_league_participation_alltime, month_labels, players)
 
-        emb = discord.Embed(title="\U0001f465 Participation \u2014 All Time")
+        emb = _league_embed(title="\U0001f465 Participation \u2014 All Time")
         emb.description = (
             f"Active players per month across **{len(aggs)}** months\n"
             f"Peak: **{max(players)}** players ({month_labels[players.index(max(players))]})"
@@ -348,7 +430,7 @@ class LeagueGraphsCog(commands.Cog):
             render_league_points_alltime, month_labels, avg_pts, min_pts, max_pts
         )
 
-        emb = discord.Embed(title="\U0001f4ca Points Spread \u2014 All Time")
+        emb = _league_embed(title="\U0001f4ca Points Spread \u2014 All Time")
         emb.description = (
             f"Average, min & max points across **{len(aggs)}** months\n"
             f"Latest avg: **{avg_pts[-1]:.0f}** pts "
@@ -378,7 +460,7 @@ class LeagueGraphsCog(commands.Cog):
             f"ECL Turn Order Win Rates \u2014 {ml}",
         )
 
-        emb = discord.Embed(title=f"\U0001f3b2 Turn Order Win Rates \u2014 {ml}")
+        emb = _league_embed(title=f"\U0001f3b2 Turn Order Win Rates \u2014 {ml}")
         rates_str = " / ".join(f"{r*100:.1f}%" for r in stats["turn_rates"])
         emb.description = (
             f"**{stats['total_pods']}** completed pods "
@@ -458,7 +540,7 @@ class LeagueGraphsCog(commands.Cog):
             "ECL Turn Order Win Rates \u2014 All Time",
         )
 
-        emb = discord.Embed(title="\U0001f3b2 Turn Order Win Rates \u2014 All Time")
+        emb = _league_embed(title="\U0001f3b2 Turn Order Win Rates \u2014 All Time")
         rates_str = " / ".join(f"{r*100:.1f}%" for r in all_rates)
         emb.description = (
             f"**{total}** pods across **{len(months_info) + 1}** months\n"
@@ -487,7 +569,7 @@ class LeagueGraphsCog(commands.Cog):
 
         overall_avg = sum(avg_games) / len(avg_games)
         peak_day = days[avg_games.index(max(avg_games))]
-        emb = discord.Embed(title="\U0001f4c5 Avg Games by Day of Month \u2014 All Time")
+        emb = _league_embed(title="\U0001f4c5 Avg Games by Day of Month \u2014 All Time")
         emb.description = (
             f"Average across all historical months\n"
             f"Overall avg: **{overall_avg:.1f}** games/day \u2022 "
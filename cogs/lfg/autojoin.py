@@ -1,51 +1,56 @@
 from __future__ import annotations
+import asyncio
 import os
 import contextlib
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 import discord
 
 from spelltable_client import create_spelltable_game
-from utils.interactions import safe_ctx_followup, resolve_member
+from utils.interactions import safe_ctx_followup, resolve_member, resolve_members
 from utils.logger import log_error
 
 from .models import LFGLobby, now_utc
+from .service import send_ready_dms, warm_ready_members
 
 # ✅ Autojoin is ONLY allowed in this channel (0 = disabled / allow anywhere)
 SPELLBOT_LFG_CHANNEL_ID = int((os.getenv("SPELLBOT_LFG_CHANNEL_ID") or "0").strip() or "0")
+_CHANNEL_GATE_ACTIVE = SPELLBOT_LFG_CHANNEL_ID > 0
+
+def _ordered_unique_ints(seq: Iterable[object]) -> List[int]:
+    """Order-preserving dedupe of the int entries in seq (bools excluded)."""
+    return list(dict.fromkeys(u for u in seq if type(u) is int))
 
 
 def _autojoin_allowed(ctx: discord.ApplicationContext) -> bool:
-    if SPELLBOT_LFG_CHANNEL_ID <= 0:
-        return True
-    try:
-        return int(getattr(ctx.channel, "id", 0)) == SPELLBOT_LFG_CHANNEL_ID
-    except Exception:
-        return False
+    return not _CHANNEL_GATE_ACTIVE or getattr(ctx.channel, "id", 0) == SPELLBOT_LFG_CHANNEL_ID
 
 
-def open_lobbies_sorted(
+def open_lobbies_partitioned(
     cog,
     guild_id: int,
     preferred_channel_id: int,
-) -> List[LFGLobby]:
-    """Open (not full) lobbies, preferring the current channel then oldest-first.
+    *,
+    min_slots: int = 1,
+) -> Tuple[List[LFGLobby], List[LFGLobby]]:
+    """Open lobbies with at least min_slots free seats as (normal, elo).
 
+    Each bucket prefers the current channel, then oldest-first.
     If SPELLBOT_LFG_CHANNEL_ID is set, only consider lobbies in that channel.
+    LobbyStore keeps each guild's lobbies in created_at order, so the buckets
+    come out oldest-first without sorting.
     """
-    lobbies = list(cog.state.peek_guild_lobbies(guild_id).values())
-
-    open_lobbies = []
-    for lob in lobbies:
-        if SPELLBOT_LFG_CHANNEL_ID > 0 and int(lob.channel_id) != int(SPELLBOT_LFG_CHANNEL_ID):
+    # [normal, elo] x [preferred channel, other channels]
+    buckets: Tuple[Tuple[List[LFGLobby], List[LFGLobby]], ...] = (([], []), ([], []))
+    for lob in cog.state.peek_guild_lobbies(guild_id).values():
+        if _CHANNEL_GATE_ACTIVE and lob.channel_id != SPELLBOT_LFG_CHANNEL_ID:
             continue
-        if cog._is_lobby_active(lob) and not lob.is_full():
-            open_lobbies.append(lob)
-
-    def key(lob: LFGLobby):
-        return (0 if lob.channel_id == preferred_channel_id else 1, lob.created_at)
+        if lob.remaining_slots() < min_slots or not cog._is_lobby_active(lob):
+            continue
+        buckets[lob.elo_mode][lob.channel_id != preferred_channel_id].append(lob)
 
-    return sorted(open_lobbies, key=key)
+    (normal_pref, normal_other), (elo_pref, elo_other) = buckets
+    return normal_pref + normal_other, elo_pref + elo_other
 
 
 async def _send_ephemeral(ctx: discord.ApplicationContext, content: str) -> None:
@@ -60,6 +65,31 @@ async def _send_ephemeral(ctx: discord.ApplicationContext, content: str) -> None
 
 
 
+def _lobby_message(
+    channel: discord.TextChannel, lobby: LFGLobby
+) -> Optional[Union[discord.Message, discord.PartialMessage]]:
+    """Return an edit target for the lobby's message without a GET.
+
+    Uses the cached message if there is one, else a PartialMessage by id
+    (cached on the lobby too); edits and deletes need only the id.
+    """
+    if lobby.message is None and lobby.message_id:
+        lobby.message = channel.get_partial_message(lobby.message_id)
+    return lobby.message
+
+
+async def _edit_lobby_message(
+    lobby: LFGLobby, msg: Union[discord.Message, discord.PartialMessage], **kwargs
+) -> None:
+    """Edit the lobby message; drop the cached copy if Discord rejects it."""
+    try:
+        await msg.edit(**kwargs)
+    except discord.HTTPException:
+        lobby.message = None
+    except Exception:
+        pass
+
+
 async def can_member_join_elo_lobby(
     cog,
     lobby: LFGLobby,
@@ -69,19 +99,21 @@ async def can_member_join_elo_lobby(
 ) -> bool:
     if not lobby.elo_mode or lobby.host_elo is None:
         return True
-
     info = await cog._get_player_elo(member)
-    if info is None:
-        return False
-    user_elo, user_games = info
-    if int(user_games) < int(elo_min_games):
-        return False
+    return can_member_join_elo_lobby_with_info(cog, lobby, info, elo_min_games=elo_min_games)
 
-    floor = cog._effective_elo_floor(lobby)
-    if floor is None:
-        return False
 
-    return float(user_elo) >= float(floor)
+def can_member_join_elo_lobby_with_info(
+    cog,
+    lobby: LFGLobby,
+    info: Optional[Tuple[float, int]],
+    *,
+    elo_min_games: int,
+) -> bool:
+    """Same as can_member_join_elo_lobby, for a (points, games) already fetched."""
+    if not lobby.elo_mode or lobby.host_elo is None:
+        return True
+    return elo_join_reason_from_info(cog, lobby, info, elo_min_games=elo_min_games) is None
 
 
 
@@ -93,23 +125,55 @@ async def elo_join_reason(
     elo_min_games: int,
 ) -> Optional[str]:
     info = await cog._get_player_elo(member)
+    return elo_join_reason_from_info(cog, lobby, info, elo_min_games=elo_min_games)
+
+
+def elo_join_reason_from_info(
+    cog,
+    lobby: LFGLobby,
+    info: Optional[Tuple[float, int]],
+    *,
+    elo_min_games: int,
+) -> Optional[str]:
+    """Same as elo_join_reason, for a (points, games) already fetched."""
     if info is None:
         return "no league rating yet"
 
     elo, games = info
-    if int(games) < int(elo_min_games):
-        return f"only {int(games)} games (need {int(elo_min_games)})"
+    if games < elo_min_games:
+        return f"only {games} games (need {elo_min_games})"
 
     floor = cog._effective_elo_floor(lobby)
     if floor is None:
         return "lobby misconfigured"
 
-    if float(elo) < float(floor):
+    if elo < floor:
         return f"needs ≥ {int(floor)} (has {int(elo)})"
 
     return None
 
 
+def _can_seat(cog, guild_id: int, lobby: LFGLobby, join_ids: List[int]) -> bool:
+    """Read-only seat checks for join_ids in lobby.
+
+    Callers run this once before any awaits (so doomed joins skip the Elo
+    lookups and the lock) and again under the guild lock, where the answer
+    is authoritative.
+    """
+    if cog.state.peek_guild_lobbies(guild_id).get(lobby.lobby_id) is not lobby:
+        return False
+    if not cog._is_lobby_active(lobby) or lobby.is_full():
+        return False
+    if len(join_ids) > lobby.remaining_slots():
+        return False
+    for uid in join_ids:
+        if lobby.has_player(uid):
+            return False
+        if cog._find_user_lobby(guild_id, uid, exclude_lobby_id=lobby.lobby_id) is not None:
+            return False
+    return True
+
+
 async def autojoin_specific_lobby_group(
     cog,
     ctx: discord.ApplicationContext,
@@ -123,49 +187,38 @@ async def autojoin_specific_lobby_group(
 
     guild: discord.Guild = ctx.guild
 
-    seen = set()
-    join_ids = [uid for uid in join_ids if isinstance(uid, int) and not (uid in seen or seen.add(uid))]
+    join_ids = _ordered_unique_ints(join_ids)
 
     lobby_id = lobby.lobby_id
     channel_id = lobby.channel_id
-    message_id = lobby.message_id
     view = lobby.view
 
+    if not _can_seat(cog, guild.id, lobby, join_ids):
+        return False
+
     pts_by_id: Dict[int, float] = {}
     if lobby.elo_mode:
-        for uid in join_ids:
-            m = guild.get_member(uid)
-            if not isinstance(m, discord.Member):
-                continue
-            info = await cog._get_player_elo(m)
-            if info is not None:
-                pts_by_id[int(uid)] = float(info[0])
+        members = await resolve_members(guild, join_ids)
+        infos = await asyncio.gather(
+            *(cog._get_player_elo(m) for m in members), return_exceptions=True
+        )
+        for m, info in zip(members, infos):
+            if info is not None and not isinstance(info, BaseException):
+                pts_by_id[int(m.id)] = float(info[0])
 
     became_full = False
     player_ids_snapshot: List[int] = []
 
-    async with cog.state.lock:
-        current = cog.state.peek_guild_lobbies(guild.id).get(lobby_id)
-        if current is None or current is not lobby:
-            return False
-        if not cog._is_lobby_active(lobby) or lobby.is_full():
-            return False
-
-        if len(join_ids) > lobby.remaining_slots():
+    async with cog.state.guild_lock(guild.id):
+        # Re-check: the lobby may have filled or closed while we awaited ratings.
+        if not _can_seat(cog, guild.id, lobby, join_ids):
             return False
 
-        for uid in join_ids:
-            other = cog._find_user_lobby(guild.id, uid, exclude_lobby_id=lobby.lobby_id)
-            if other is not None:
-                return False
-            if uid in lobby.player_ids:
-                return False
-
-        lobby.player_ids.extend(join_ids)
+        cog.state.add_players(lobby, join_ids)
 
         if lobby.elo_mode and pts_by_id:
             for uid, pts in pts_by_id.items():
-                if uid in lobby.player_ids:
+                if lobby.has_player(uid):
                     lobby.player_pts[uid] = float(pts)
 
         if lobby.elo_mode and lobby.remaining_slots() == 1 and lobby.almost_full_at is None:
@@ -173,25 +226,25 @@ async def autojoin_specific_lobby_group(
             if not cog._is_last_seat_open(lobby):
                 cog._ensure_elo_embed_updater(lobby)
 
-        became_full = lobby.is_full() and not lobby.has_link() and not getattr(lobby, "link_creating", False)
+        became_full = lobby.is_full() and not lobby.has_link() and not lobby.link_creating
         if became_full:
             lobby.link_creating = True
         player_ids_snapshot = list(lobby.player_ids)
-        
-    with contextlib.suppress(Exception):
-        await cog._save_lobby_to_db(lobby)
+
+    if became_full:
+        # Room creation is about to start: persist link_creating right away.
+        with contextlib.suppress(Exception):
+            await cog._save_lobby_to_db(lobby)
+    else:
+        cog._mark_lobby_dirty(lobby)
 
 
     channel = guild.get_channel(channel_id)
     if not isinstance(channel, discord.TextChannel):
         return True
 
-    msg: Optional[discord.Message] = None
-    if message_id:
-        with contextlib.suppress(Exception):
-            msg = await channel.fetch_message(message_id)
-
     if became_full:
+        msg = _lobby_message(channel, lobby)
         started_at = now_utc()
         link_created: Optional[str] = None
         try:
@@ -206,17 +259,17 @@ async def autojoin_specific_lobby_group(
         if link_created:
             dm_targets: list[int] = []
             finalize = False
-            async with cog.state.lock:
+            async with cog.state.guild_lock(guild.id):
                 current = cog.state.peek_guild_lobbies(guild.id).get(lobby_id)
                 if current is not None and current is lobby:
+                    lobby.link_creating = False
+                    # If a player left during room creation, abort and leave the lobby open.
                     if lobby.is_full() and not lobby.has_link():
                         lobby.link = link_created
-                        lobby.link_creating = False
                         dm_targets = list(lobby.player_ids)
                         finalize = True
-                    else:
-                        # A player left during room creation — abort, re-open the lobby.
-                        lobby.link_creating = False
+                        # Finalised: drop it from state in the same critical section.
+                        cog._clear_lobby(guild.id, lobby_id)
 
             if not finalize:
                 log_error(
@@ -225,9 +278,8 @@ async def autojoin_specific_lobby_group(
                 )
                 if msg and view:
                     embed = cog._build_lobby_embed(guild, lobby)
-                    view._sync_open_last_seat_button()
-                    with contextlib.suppress(Exception):
-                        await msg.edit(embed=embed, view=view)
+                    view._sync_buttons()
+                    await _edit_lobby_message(lobby, msg, embed=embed, view=view)
                 with contextlib.suppress(Exception):
                     await safe_ctx_followup(
                         ctx,
@@ -236,28 +288,16 @@ async def autojoin_specific_lobby_group(
                     )
                 return True
 
+            dm_members = await warm_ready_members(guild, dm_targets)
             ready_embed = await cog._build_ready_embed(guild, lobby, started_at)
 
             if msg:
-                with contextlib.suppress(Exception):
-                    await msg.edit(embed=ready_embed, view=None)
+                await _edit_lobby_message(lobby, msg, embed=ready_embed, view=None)
 
             with contextlib.suppress(Exception):
                 await cog._maybe_announce_high_stakes(channel, guild, dm_targets)
 
-            for uid in dm_targets:
-                m = await resolve_member(guild, uid)
-                if not m or m.bot:
-                    continue
-                try:
-                    await m.send(embed=ready_embed)
-                except discord.Forbidden:
-                    continue
-                except Exception as e:
-                    log_error(f"[lfg] autojoin ready DM to {uid} failed: {type(e).__name__}: {e}")
-
-            async with cog.state.lock:
-                cog._clear_lobby(guild.id, lobby_id)
+            await send_ready_dms(guild, dm_members, ready_embed)
 
             with contextlib.suppress(Exception):
                 await safe_ctx_followup(
@@ -266,7 +306,7 @@ async def autojoin_specific_lobby_group(
                     ephemeral=True,
                 )
         else:
-            async with cog.state.lock:
+            async with cog.state.guild_lock(guild.id):
                 current = cog.state.peek_guild_lobbies(guild.id).get(lobby_id)
                 if current is not None and current is lobby:
                     lobby.link_creating = False
@@ -278,11 +318,8 @@ async def autojoin_specific_lobby_group(
                 )
         return True
 
-    if msg and view:
-        embed = cog._build_lobby_embed(guild, lobby)
-        view._sync_open_last_seat_button()
-        with contextlib.suppress(Exception):
-            await msg.edit(embed=embed, view=view)
+    # Debounced: a burst of autojoins into this lobby becomes one message edit
+    cog._schedule_lobby_edit(lobby)
 
     with contextlib.suppress(Exception):
         await safe_ctx_followup(ctx, f"Joined an existing lobby in <#{channel_id}> ✅", ephemeral=True)
@@ -304,6 +341,13 @@ async def autojoin_specific_lobby_from_lfg(
     guild: discord.Guild = ctx.guild
     joiner: discord.Member = ctx.author
 
+    requested_size = 1 + len(invited_ids)
+
+    if invited_ids and lobby.elo_mode:
+        return False
+    if requested_size > lobby.remaining_slots() or not _can_seat(cog, guild.id, lobby, [joiner.id]):
+        return False
+
     joiner_pts: Optional[float] = None
     if lobby.elo_mode:
         info = await cog._get_player_elo(joiner)
@@ -312,34 +356,17 @@ async def autojoin_specific_lobby_from_lfg(
 
     lobby_id = lobby.lobby_id
     channel_id = lobby.channel_id
-    message_id = lobby.message_id
     view = lobby.view
 
-    requested_size = 1 + len(invited_ids)
-
     became_full = False
     player_ids_snapshot: List[int] = []
 
-    async with cog.state.lock:
-        current = cog.state.peek_guild_lobbies(guild.id).get(lobby_id)
-        if current is None or current is not lobby:
-            return False
-        if not cog._is_lobby_active(lobby) or lobby.is_full():
-            return False
-
-        if cog._find_user_lobby(guild.id, joiner.id) is not None:
-            return False
-
-        if joiner.id in lobby.player_ids:
-            return False
-
-        if invited_ids and lobby.elo_mode:
-            return False
-
-        if requested_size > lobby.remaining_slots():
+    async with cog.state.guild_lock(guild.id):
+        # Re-check: the lobby may have filled or closed while we awaited the rating.
+        if requested_size > lobby.remaining_slots() or not _can_seat(cog, guild.id, lobby, [joiner.id]):
             return False
 
-        lobby.player_ids.append(joiner.id)
+        cog.state.add_players(lobby, [joiner.id])
 
         if lobby.elo_mode and joiner_pts is not None:
             lobby.player_pts[joiner.id] = float(joiner_pts)
@@ -349,39 +376,38 @@ async def autojoin_specific_lobby_from_lfg(
                 break
             if uid == joiner.id:
                 continue
-            if uid in lobby.player_ids:
+            if lobby.has_player(uid):
                 continue
             if cog._find_user_lobby(guild.id, uid, exclude_lobby_id=lobby.lobby_id) is not None:
                 continue
-            lobby.player_ids.append(uid)
+            cog.state.add_players(lobby, [uid])
 
         if lobby.elo_mode and lobby.remaining_slots() == 1 and lobby.almost_full_at is None:
             lobby.almost_full_at = now_utc()
             if not cog._is_last_seat_open(lobby):
                 cog._ensure_elo_embed_updater(lobby)
 
-        became_full = lobby.is_full() and not lobby.has_link() and not getattr(lobby, "link_creating", False)
+        became_full = lobby.is_full() and not lobby.has_link() and not lobby.link_creating
         if became_full:
             lobby.link_creating = True
         player_ids_snapshot = list(lobby.player_ids)
-    
-    with contextlib.suppress(Exception):
-        await cog._save_lobby_to_db(lobby)
+
+    if became_full:
+        # Room creation is about to start: persist link_creating right away.
+        with contextlib.suppress(Exception):
+            await cog._save_lobby_to_db(lobby)
+    else:
+        cog._mark_lobby_dirty(lobby)
 
 
     channel = guild.get_channel(channel_id)
     if not isinstance(channel, discord.TextChannel):
         return True
 
-    msg: Optional[discord.Message] = None
-    if message_id:
-        with contextlib.suppress(Exception):
-            msg = await channel.fetch_message(message_id)
-
     if became_full:
+        msg = _lobby_message(channel, lobby)
         started_at = now_utc()
         link_created: Optional[str] = None
-
         try:
             link_created = await create_spelltable_game(
                 game_name="ECL DragonShield",
@@ -394,17 +420,17 @@ async def autojoin_specific_lobby_from_lfg(
         if link_created:
             dm_targets: list[int] = []
             finalize = False
-            async with cog.state.lock:
+            async with cog.state.guild_lock(guild.id):
                 current = cog.state.peek_guild_lobbies(guild.id).get(lobby_id)
                 if current is not None and current is lobby:
+                    lobby.link_creating = False
+                    # If a player left during room creation, abort and leave the lobby open.
                     if lobby.is_full() and not lobby.has_link():
                         lobby.link = link_created
-                        lobby.link_creating = False
                         dm_targets = list(lobby.player_ids)
                         finalize = True
-                    else:
-                        # A player left during room creation — abort, re-open the lobby.
-                        lobby.link_creating = False
+                        # Finalised: drop it from state in the same critical section.
+                        cog._clear_lobby(guild.id, lobby_id)
 
             if not finalize:
                 log_error(
@@ -413,9 +439,8 @@ async def autojoin_specific_lobby_from_lfg(
                 )
                 if msg and view:
                     embed = cog._build_lobby_embed(guild, lobby)
-                    view._sync_open_last_seat_button()
-                    with contextlib.suppress(Exception):
-                        await msg.edit(embed=embed, view=view)
+                    view._sync_buttons()
+                    await _edit_lobby_message(lobby, msg, embed=embed, view=view)
                 with contextlib.suppress(Exception):
                     await safe_ctx_followup(
                         ctx,
@@ -424,28 +449,16 @@ async def autojoin_specific_lobby_from_lfg(
                     )
                 return True
 
+            dm_members = await warm_ready_members(guild, dm_targets)
             ready_embed = await cog._build_ready_embed(guild, lobby, started_at)
 
             if msg:
-                with contextlib.suppress(Exception):
-                    await msg.edit(embed=ready_embed, view=None)
+                await _edit_lobby_message(lobby, msg, embed=ready_embed, view=None)
 
             with contextlib.suppress(Exception):
                 await cog._maybe_announce_high_stakes(channel, guild, dm_targets)
 
-            for uid in dm_targets:
-                m = await resolve_member(guild, uid)
-                if not m or m.bot:
-                    continue
-                try:
-                    await m.send(embed=ready_embed)
-                except discord.Forbidden:
-                    continue
-                except Exception as e:
-                    log_error(f"[lfg] autojoin ready DM to {uid} failed: {type(e).__name__}: {e}")
-
-            async with cog.state.lock:
-                cog._clear_lobby(guild.id, lobby_id)
+            await send_ready_dms(guild, dm_members, ready_embed)
 
             with contextlib.suppress(Exception):
                 await safe_ctx_followup(
@@ -454,7 +467,7 @@ async def autojoin_specific_lobby_from_lfg(
                     ephemeral=True,
                 )
         else:
-            async with cog.state.lock:
+            async with cog.state.guild_lock(guild.id):
                 current = cog.state.peek_guild_lobbies(guild.id).get(lobby_id)
                 if current is not None and current is lobby:
                     lobby.link_creating = False
@@ -467,11 +480,8 @@ async def autojoin_specific_lobby_from_lfg(
 
         return True
 
-    if msg and view:
-        embed = cog._build_lobby_embed(guild, lobby)
-        view._sync_open_last_seat_button()
-        with contextlib.suppress(Exception):
-            await msg.edit(embed=embed, view=view)
+    # Debounced: a burst of autojoins into this lobby becomes one message edit
+    cog._schedule_lobby_edit(lobby)
 
     with contextlib.suppress(Exception):
         await safe_ctx_followup(
@@ -499,17 +509,19 @@ async def try_join_existing_for_lfgelo(
     preferred_channel_id = ctx.channel.id
     joiner: discord.Member = ctx.author
 
-    async with cog.state.lock:
+    async with cog.state.guild_lock(guild_id):
         if cog._find_user_lobby(guild_id, joiner.id) is not None:
             return False
-        open_lobbies = open_lobbies_sorted(cog, guild_id, preferred_channel_id)
+        _, elo_lobbies = open_lobbies_partitioned(cog, guild_id, preferred_channel_id)
 
-    for lob in open_lobbies:
-        if not lob.elo_mode:
-            continue
-        if lob.remaining_slots() <= 0:
-            continue
-        if not await can_member_join_elo_lobby(cog, lob, joiner, elo_min_games=int(elo_min_games)):
+    if not elo_lobbies:
+        return False
+
+    # One rating lookup for the joiner; each lobby then only compares floors.
+    joiner_info = await cog._get_player_elo(joiner)
+
+    for lob in elo_lobbies:
+        if not can_member_join_elo_lobby_with_info(cog, lob, joiner_info, elo_min_games=elo_min_games):
             continue
         if await autojoin_specific_lobby_from_lfg(cog, ctx, lob, []):
             return True
@@ -536,51 +548,52 @@ async def try_join_existing_for_lfg(
     preferred_channel_id = ctx.channel.id
     joiner = ctx.author
 
-    seen = set()
-    invited_ids = [uid for uid in invited_ids if isinstance(uid, int) and not (uid in seen or seen.add(uid))]
+    invited_ids = _ordered_unique_ints(invited_ids)
 
     want_friends = len(invited_ids) > 0
     join_ids = [joiner.id] + invited_ids
     requested_size = len(join_ids)
 
-    async with cog.state.lock:
+    async with cog.state.guild_lock(guild_id):
         if cog._find_user_lobby(guild_id, joiner.id) is not None:
             return False
-        open_lobbies = open_lobbies_sorted(cog, guild_id, preferred_channel_id)
+        # One scan classifies every lobby that can seat the whole group.
+        normal_lobbies, elo_lobbies = open_lobbies_partitioned(
+            cog, guild_id, preferred_channel_id, min_slots=requested_size
+        )
 
-    for lob in open_lobbies:
-        if lob.elo_mode:
-            continue
-        if requested_size > lob.remaining_slots():
-            continue
+    # Seats can fill while we await; autojoin_specific_lobby_group re-checks under the lock.
+    for lob in normal_lobbies:
         if await autojoin_specific_lobby_group(cog, ctx, lob, join_ids):
             return True
 
     if not want_friends:
-        for lob in open_lobbies:
-            if not lob.elo_mode:
-                continue
-            if lob.remaining_slots() < 1:
-                continue
-            if not await can_member_join_elo_lobby(cog, lob, joiner, elo_min_games=int(elo_min_games)):
+        joiner_info = await cog._get_player_elo(joiner) if elo_lobbies else None
+        for lob in elo_lobbies:
+            if not can_member_join_elo_lobby_with_info(cog, lob, joiner_info, elo_min_games=elo_min_games):
                 continue
             if await autojoin_specific_lobby_group(cog, ctx, lob, [joiner.id]):
                 return True
         return False
 
-    for lob in open_lobbies:
-        if not lob.elo_mode:
-            continue
-        if requested_size > lob.remaining_slots():
-            continue
+    if not elo_lobbies:
+        return False
+
+    # Resolve the group and their ratings once; each lobby then only compares floors.
+    members = await asyncio.gather(*(resolve_member(guild, uid) for uid in join_ids))
+
+    async def _info(m: Optional[discord.Member]) -> Optional[Tuple[float, int]]:
+        return await cog._get_player_elo(m) if m is not None else None
+
+    infos = await asyncio.gather(*(_info(m) for m in members))
 
+    for lob in elo_lobbies:
         failures: List[str] = []
-        for uid in join_ids:
-            m = await resolve_member(guild, uid)
+        for uid, m, info in zip(join_ids, members, infos):
             if m is None:
                 failures.append(f"<@{uid}>: not a server member")
                 continue
-            reason = await elo_join_reason(cog, lob, m, elo_min_games=int(elo_min_games))
+            reason = elo_join_reason_from_info(cog, lob, info, elo_min_games=elo_min_games)
             if reason:
                 failures.append(f"{m.mention}: {reason}")
 
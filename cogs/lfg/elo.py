@@ -12,7 +12,9 @@ Keep these helpers mostly pure so cogs stay thin.
 """
 
 import math
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import discord
 
@@ -27,12 +29,99 @@ from utils.topdeck_identity import (
 from .models import LFGLobby, now_utc
 
 
+@dataclass
+class LeagueIndex:
+    """Lookup tables derived from one TopDeck fetch (see get_league_index)."""
+
+    fetched_at: datetime
+    # discord id -> (pts, games), first matching row wins
+    by_discord_id: Dict[int, Tuple[float, int]]
+    # normalized handle -> best (pts, games) and how many rows share it
+    handle_best: Dict[str, Tuple[float, int]]
+    handle_count: Dict[str, int]
+    # min_games -> ascending pts of rows with games >= min_games (filled lazily;
+    # tuples because every caller shares them until the next fetch)
+    sorted_pts: Dict[int, Tuple[float, ...]] = field(default_factory=dict)
+    rows_pts_games: List[Tuple[float, int]] = field(default_factory=list)
+
+    def pts_sorted(self, min_games: int) -> Tuple[float, ...]:
+        mg = int(min_games)
+        vals = self.sorted_pts.get(mg)
+        if vals is None:
+            vals = tuple(sorted(p for p, g in self.rows_pts_games if g >= mg))
+            self.sorted_pts[mg] = vals
+        return vals
+
+
+# (bracket_id, token) -> LeagueIndex, rebuilt whenever the shared rows cache refetches
+_LEAGUE_INDEX_CACHE: Dict[Tuple[str, str], LeagueIndex] = {}
+
+
+def _build_league_index(rows, fetched_at: datetime) -> LeagueIndex:
+    by_id: Dict[int, Tuple[float, int]] = {}
+    handle_best: Dict[str, Tuple[float, int]] = {}
+    handle_count: Dict[str, int] = {}
+    pts_games: List[Tuple[float, int]] = []
+
+    # One pass over the rows fills every table; PlayerRow fields are always set.
+    for r in rows:
+        pg = (float(r.pts), int(r.games))
+        pts_games.append(pg)
+        pts, games = pg
+
+        raw = r.discord or ""
+
+        did = extract_discord_id(raw)
+        if did is not None and did not in by_id:
+            by_id[did] = pg
+
+        h = normalize_topdeck_discord(raw)
+        if not h:
+            continue
+
+        handle_count[h] = handle_count.get(h, 0) + 1
+
+        prev = handle_best.get(h)
+        if prev is None or pts > prev[0] or (pts == prev[0] and games > prev[1]):
+            handle_best[h] = pg
+
+    return LeagueIndex(
+        fetched_at=fetched_at,
+        by_discord_id=by_id,
+        handle_best=handle_best,
+        handle_count=handle_count,
+        rows_pts_games=pts_games,
+    )
+
+
+async def get_league_index(
+    bracket_id: str,
+    firebase_id_token: Optional[str],
+    *,
+    force_refresh: bool = False,
+) -> LeagueIndex:
+    """Return the LeagueIndex for the current TopDeck rows (cached per fetch)."""
+    rows, fetched_at = await get_league_rows_cached(
+        bracket_id,
+        firebase_id_token,
+        force_refresh=force_refresh,
+    )
+    key = (bracket_id, firebase_id_token or "")
+    cached = _LEAGUE_INDEX_CACHE.get(key)
+    if cached is not None and cached.fetched_at == fetched_at:
+        return cached
+
+    idx = _build_league_index(rows or [], fetched_at)
+    _LEAGUE_INDEX_CACHE[key] = idx
+    return idx
+
+
 def round_up(value: float, unit: int) -> int:
     unit = max(1, int(unit))
     return int(math.ceil(float(value) / unit) * unit)
 
 
-def percentile_sorted(vals: List[float], q: float) -> Optional[float]:
+def percentile_sorted(vals: Sequence[float], q: float) -> Optional[float]:
     """Return q percentile (0..1) from a pre-sorted list."""
     if not vals:
         return None
@@ -70,14 +159,11 @@ async def compute_dynamic_window(
         return base_range, range_step
 
     try:
-        rows, _ = await get_league_rows_cached(bracket_id, firebase_id_token)
+        idx = await get_league_index(bracket_id, firebase_id_token)
     except Exception:
         return base_range, range_step
 
-    pts = sorted(
-        float(r.pts) for r in rows
-        if getattr(r, "games", 0) >= int(min_games)
-    )
+    pts = idx.pts_sorted(int(min_games))
 
     if len(pts) < 10:
         return base_range, range_step
@@ -272,7 +358,7 @@ async def get_member_points_games(
         return None
 
     try:
-        rows, _ = await get_league_rows_cached(
+        idx = await get_league_index(
             bracket_id,
             firebase_id_token,
             force_refresh=force_refresh,
@@ -280,39 +366,15 @@ async def get_member_points_games(
     except Exception:
         return None
 
-    if not rows:
-        return None
-
     # 1) Strong match: Discord ID
-    target_id = int(member.id)
-    for r in rows:
-        did = extract_discord_id(getattr(r, "discord", "") or "")
-        if did == target_id:
-            return float(getattr(r, "pts", 0) or 0), int(getattr(r, "games", 0) or 0)
-
-    # 2) Build handle -> (best pts,games) AND handle -> count
-    handle_best: Dict[str, Tuple[float, int]] = {}
-    handle_count: Dict[str, int] = {}
-
-    for r in rows:
-        h = normalize_topdeck_discord(getattr(r, "discord", "") or "")
-        if not h:
-            continue
-
-        handle_count[h] = handle_count.get(h, 0) + 1
-
-        pts = float(getattr(r, "pts", 0) or 0)
-        games = int(getattr(r, "games", 0) or 0)
-
-        prev = handle_best.get(h)
-        if prev is None or pts > prev[0] or (pts == prev[0] and games > prev[1]):
-            handle_best[h] = (pts, games)
+    found = idx.by_discord_id.get(int(member.id))
+    if found is not None:
+        return found
 
-    # 3) Only accept UNIQUE handle matches (count == 1)
-    candidates = member_handle_candidates(member)
-    for h in candidates:
-        if handle_count.get(h, 0) == 1 and h in handle_best:
-            pts, games = handle_best[h]
+    # 2) Only accept UNIQUE handle matches (count == 1)
+    for h in member_handle_candidates(member):
+        if idx.handle_count.get(h, 0) == 1 and h in idx.handle_best:
+            pts, games = idx.handle_best[h]
             return float(pts), int(games)
 
     # If handle match exists but ambiguous, DO NOT guess
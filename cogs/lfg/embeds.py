@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import List, Optional, Mapping
 
 import discord
 
 from .models import LFGLobby
 
+# Cached "Players" lines are re-rendered after this long so nickname changes show up
+PLAYER_LINE_TTL_SECONDS = 60.0
+
 
 def ts(dt: datetime) -> int:
     return int(dt.timestamp())
@@ -48,51 +52,59 @@ def build_lobby_embed(
     else:
         title = f"Waiting for {remaining} more players to join..."
 
-    description = "*A SpellTable link will be created when all players have joined.*\n\n"
+    parts: List[str] = ["*A SpellTable link will be created when all players have joined.*\n\n"]
 
     if elo_info is not None and lobby.elo_mode:
-        description += (
-            f"Host rating: **{int(elo_info.host_elo)}**\n"
-            f"Minimum rating to join: **≥ {int(elo_info.min_rating)}** points\n"
-        )
+        parts.append(f"Host rating: **{elo_info.host_elo}**\n")
+        parts.append(f"Minimum rating to join: **≥ {elo_info.min_rating}** points\n")
 
         if elo_info.at_bottom:
-            description += "*(We're already at the bottom.)*\n"
+            parts.append("*(We're already at the bottom.)*\n")
         else:
-            description += f"(Floor expands every {int(expand_interval_min)} minutes.)\n"
+            parts.append(f"(Floor expands every {expand_interval_min} minutes.)\n")
 
         if remaining == 1 and elo_info.last_seat is not None:
             ls = elo_info.last_seat
             if ls.is_open:
-                description += f"Last seat: **OPEN** *(≥ {int(ls.min_rating)})*\n\n"
+                parts.append(f"Last seat: **OPEN** *(≥ {ls.min_rating})*\n\n")
             else:
-                mins_left = int(ls.minutes_left) if ls.minutes_left is not None else int(last_seat_grace_min)
-                description += (
-                    f"Last seat: **LOCKED** *(opens to ≥ {int(ls.min_rating)} in ~{mins_left} min "
+                mins_left = ls.minutes_left if ls.minutes_left is not None else last_seat_grace_min
+                parts.append(
+                    f"Last seat: **LOCKED** *(opens to ≥ {ls.min_rating} in ~{mins_left} min "
                     f"or host can open it now.)*\n\n"
                 )
         else:
-            description += "\n"
+            parts.append("\n")
 
     embed = discord.Embed(
         title=title,
-        description=description,
+        description="".join(parts),
         color=discord.Color.yellow() if lobby.elo_mode else discord.Color.dark_grey(),
     )
 
     lines: List[str] = []
+    cache = lobby.player_lines
+    now = time.monotonic()
+    pts_map = lobby.player_pts if lobby.elo_mode else {}
     for uid in lobby.player_ids:
-        pts_suffix = ""
-        if lobby.elo_mode:
-            pts = getattr(lobby, "player_pts", {}).get(uid)
-            if pts is not None:
-                pts_suffix = f" (**{int(pts)} pts**)"
+        pts = pts_map.get(uid)
+
+        # Reuse a recent line from a previous render unless this player's pts changed
+        hit = cache.get(uid)
+        if hit is not None and hit[0] == pts and now - hit[2] < PLAYER_LINE_TTL_SECONDS:
+            lines.append(hit[1])
+            continue
+
+        pts_suffix = f" (**{int(pts)} pts**)" if pts is not None else ""
 
         member = guild.get_member(uid)
         if member:
-            lines.append(f"• {member.mention} ({member.display_name}){pts_suffix}")
+            line = f"• {member.mention} ({member.display_name}){pts_suffix}"
+            cache[uid] = (pts, line, now)
         else:
-            lines.append(f"• <@{uid}> (User {uid}){pts_suffix}")
+            # Not cached: retry the member lookup on the next render
+            line = f"• <@{uid}> (User {uid}){pts_suffix}"
+        lines.append(line)
 
     embed.add_field(name="Players", value="\n".join(lines) if lines else "*No players yet*", inline=False)
     embed.add_field(name="Format", value="Commander", inline=True)
@@ -104,6 +116,15 @@ def build_lobby_embed(
     return embed
 
 
+def lobby_embed_key(embed: discord.Embed, view: Optional[discord.ui.View] = None) -> int:
+    """Fingerprint of what a lobby message shows, ignoring the "Updated at" stamp."""
+    fields = tuple((f.name, f.value) for f in embed.fields if f.name != "Updated at")
+    buttons = tuple(
+        (getattr(c, "custom_id", None), getattr(c, "disabled", None)) for c in (view.children if view else ())
+    )
+    return hash((embed.title, embed.description, fields, buttons))
+
+
 def build_ready_embed(
     guild: discord.Guild,
     lobby: LFGLobby,
@@ -112,7 +133,7 @@ def build_ready_embed(
     icon_url: str = "",
     pts_by_id: Optional[Mapping[int, int]] = None,  # ✅ new
 ) -> discord.Embed:
-    started_at = started_at.astimezone(timezone.utc)
+    """started_at must be tz-aware (callers pass now_utc()); ts() is zone-independent for those."""
     started_ts = ts(started_at)
 
     embed = discord.Embed(
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 
 
 def now_utc() -> datetime:
@@ -10,12 +10,42 @@ def now_utc() -> datetime:
 
 
 if TYPE_CHECKING:
+    import discord
+
     from .views import LFGJoinView
 
 
 class LFGLobby:
     """In-memory state for a single LFG lobby."""
 
+    # Fixed attribute set: smaller instances and faster attribute access on the join paths
+    __slots__ = (
+        "guild_id",
+        "channel_id",
+        "host_id",
+        "max_seats",
+        "_players",
+        "invited_ids",
+        "message_id",
+        "message",
+        "link",
+        "link_creating",
+        "player_pts",
+        "lobby_id",
+        "elo_mode",
+        "host_elo",
+        "created_at",
+        "elo_base_range",
+        "elo_range_step",
+        "elo_max_steps",
+        "almost_full_at",
+        "last_seat_open",
+        "view",
+        "update_task",
+        "player_lines",
+        "embed_key",
+    )
+
     def __init__(
         self,
         guild_id: int,
@@ -32,9 +62,11 @@ class LFGLobby:
         self.channel_id = int(channel_id)
         self.host_id = int(host_id)
         self.max_seats = int(max_seats)
-        self.player_ids: List[int] = [int(host_id)]  # host always first
+        self.player_ids = [int(host_id)]  # host always first
         self.invited_ids: List[int] = invited_ids or []
         self.message_id: Optional[int] = None   # set after we send the embed
+        # Edit target for message_id: the Message when we have one, else a PartialMessage
+        self.message: Optional[Union[discord.Message, discord.PartialMessage]] = None
         self.link: str = ""                     # SpellTable link once lobby is full
 
         # True while we're creating a SpellTable room (prevents duplicate creation)
@@ -66,11 +98,36 @@ class LFGLobby:
         self.view: Optional[LFGJoinView] = None
         self.update_task: Optional[asyncio.Task] = None
 
+        # uid -> (pts, rendered "Players" line, monotonic time) for lobby embed re-renders; see lfg.embeds
+        self.player_lines: Dict[int, Tuple[Optional[float], str, float]] = {}
+
+        # Fingerprint of the embed the Elo updater last pushed; None after any other rebuild
+        self.embed_key: Optional[int] = None
+
+    @property
+    def player_ids(self) -> List[int]:
+        """Seated players in join order (a fresh list; mutate via add/discard_player)."""
+        return list(self._players)
+
+    @player_ids.setter
+    def player_ids(self, ids: List[int]) -> None:
+        # dict as an insertion-ordered set: O(1) add, discard and membership
+        self._players: Dict[int, None] = dict.fromkeys(int(x) for x in ids)
+
+    def add_player(self, user_id: int) -> None:
+        self._players[int(user_id)] = None
+
+    def discard_player(self, user_id: int) -> None:
+        self._players.pop(int(user_id), None)
+
+    def has_player(self, user_id: int) -> bool:
+        return user_id in self._players
+
     def is_full(self) -> bool:
-        return len(self.player_ids) >= self.max_seats
+        return len(self._players) >= self.max_seats
 
     def remaining_slots(self) -> int:
-        return max(0, self.max_seats - len(self.player_ids))
+        return max(0, self.max_seats - len(self._players))
 
     def has_link(self) -> bool:
         return bool(self.link)
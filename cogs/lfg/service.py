@@ -1,29 +1,56 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import discord
 
 from spelltable_client import create_spelltable_game
-from utils.interactions import safe_i_send, safe_i_edit, resolve_member
+from utils.interactions import safe_i_send, safe_i_edit, resolve_member, resolve_members
 from utils.logger import log_error
 
 from .models import now_utc
 from .views import LFGJoinView
 
+async def warm_ready_members(
+    guild: discord.Guild,
+    user_ids: List[int],
+) -> Dict[int, Optional[discord.Member]]:
+    """Pull uncached pod members in one query before the READY embed and DMs.
+
+    Both look members up via guild.get_member; warming the cache first keeps
+    display names in the embed and saves a fetch per DM.
+    """
+    members = await resolve_members(guild, user_ids)
+    by_id = {int(m.id): m for m in members}
+    return {uid: by_id.get(uid) for uid in user_ids}
 
-def _disable_join_button(view: LFGJoinView) -> None:
-    for child in view.children:
-        if isinstance(child, discord.ui.Button) and child.custom_id == "lfg_join_button":
-            child.disabled = True
 
+async def send_ready_dms(
+    guild: discord.Guild,
+    members: Dict[int, Optional[discord.Member]],
+    embed: discord.Embed,
+) -> None:
+    """DM the ready embed to every (non-bot) player concurrently.
 
-def _disable_all_buttons(view: LFGJoinView) -> None:
-    for child in view.children:
-        if isinstance(child, discord.ui.Button):
-            child.disabled = True
+    `members` maps user id -> cached Member (or None to fetch it here).
+    Pods have at most 4 seats; 429s are retried by the library's HTTP client.
+    """
+    async def _one(uid: int, m: Optional[discord.Member]) -> None:
+        if m is None:
+            m = await resolve_member(guild, uid)
+        if not m or m.bot:
+            return
+        try:
+            await m.send(embed=embed)
+        except discord.Forbidden:
+            pass
+        except Exception as e:
+            log_error(f"[lfg] ready DM to {uid} failed: {type(e).__name__}: {e}")
+
+    await asyncio.gather(*(_one(uid, m) for uid, m in members.items()))
 
 
 async def handle_open_last_seat(
@@ -50,12 +77,12 @@ async def handle_open_last_seat(
     reply_ephemeral: Optional[str] = None
     success_ephemeral: Optional[str] = None
 
-    async with cog.state.lock:
+    async with cog.state.guild_lock(guild.id):
         lobbies = cog.state.peek_guild_lobbies(guild.id)
         lobby = lobbies.get(view.lobby.lobby_id)
 
         if lobby is None or lobby is not view.lobby:
-            _disable_all_buttons(view)
+            view.disable_all_buttons()
             edit_content = "This lobby is no longer active."
             edit_view = view
         else:
@@ -75,7 +102,7 @@ async def handle_open_last_seat(
                 lobby.almost_full_at = lobby.almost_full_at or now_utc()
 
                 embed = cog._build_lobby_embed(guild, lobby)
-                view._sync_open_last_seat_button()
+                view._sync_buttons()
 
                 edit_embed = embed
                 edit_view = view
@@ -144,28 +171,28 @@ async def handle_join(
     should_check_high_stakes = False
     high_stakes_player_ids: List[int] = []
 
-    async with cog.state.lock:
+    async with cog.state.guild_lock(guild.id):
         lobbies = cog.state.peek_guild_lobbies(guild.id)
         lobby = lobbies.get(view.lobby.lobby_id)
 
         if lobby is None or lobby is not view.lobby:
-            _disable_all_buttons(view)
+            view.disable_all_buttons()
             edit_content = "This lobby is no longer active."
             edit_view = view
         else:
-            other = cog._find_user_lobby(guild.id, user.id, exclude_lobby_id=lobby.lobby_id)
-            if other is not None:
+            # Same-lobby repeat clicks are the common duplicate; check them before the index
+            if lobby.has_player(user.id):
+                reply_ephemeral = "You're already in this lobby."
+            elif cog._find_user_lobby(guild.id, user.id, exclude_lobby_id=lobby.lobby_id) is not None:
                 reply_ephemeral = (
                     "You're already in another active lobby in this server. "
                     "Leave it before joining a new one."
                 )
-            elif user.id in lobby.player_ids:
-                reply_ephemeral = "You're already in this lobby."
             elif lobby.is_full():
-                _disable_all_buttons(view)
+                view.disable_all_buttons()
                 # Don't tear down a lobby that's mid-finalization (a SpellTable link
                 # is being created/applied) — the in-flight finalize owns cleanup.
-                if not getattr(lobby, "link_creating", False) and not lobby.has_link():
+                if not lobby.link_creating and not lobby.has_link():
                     lobby_id_to_clear = lobby.lobby_id
                 edit_view = view
                 reply_ephemeral = "This lobby is already full."
@@ -178,17 +205,18 @@ async def handle_join(
                         )
                     else:
                         user_elo, user_games = user_info
-                        if int(user_games) < int(elo_min_games):
+                        # _get_player_elo already returns (float, int); elo_min_games is an int
+                        if user_games < elo_min_games:
                             reply_ephemeral = (
-                                f"This Elo-matched pod requires at least **{int(elo_min_games)}** league games.\n"
-                                f"You currently have **{int(user_games)}**.\n"
+                                f"This Elo-matched pod requires at least **{elo_min_games}** league games.\n"
+                                f"You currently have **{user_games}**.\n"
                                 "Use /lfg for now and come back once you\'ve got more games logged."
                             )
                         else:
                             floor = cog._effective_elo_floor(lobby)
                             if floor is None:
                                 reply_ephemeral = "This Elo-matched lobby is misconfigured. Please ping a mod."
-                            elif float(user_elo) < float(floor):
+                            elif user_elo < floor:
                                 msg = (
                                     f"This Elo pod currently requires **≥ {int(floor)}** points.\n"
                                     f"Your rating: **{int(user_elo)}**.\n"
@@ -197,17 +225,17 @@ async def handle_join(
                                 if lobby.remaining_slots() == 1 and not cog._is_last_seat_open(lobby):
                                     relaxed_floor = cog._relaxed_last_seat_floor(lobby)
                                     if relaxed_floor is not None:
-                                        mins_left = int(last_seat_grace_min)
+                                        mins_left = last_seat_grace_min
                                         if lobby.almost_full_at is not None:
                                             elapsed = (now_utc() - lobby.almost_full_at).total_seconds() / 60.0
-                                            mins_left = max(0, int(round(float(last_seat_grace_min) - elapsed)))
+                                            mins_left = max(0, round(last_seat_grace_min - elapsed))
                                         msg += (
                                             f"The last seat will open to **≥ {int(relaxed_floor)}** in ~{mins_left} min, "
                                             f"or the host can open it now."
                                         )
                                 else:
                                     rng = cog._current_downward_range(lobby) or 0.0
-                                    if float(rng) >= float(cog._max_downward_range(lobby)):
+                                    if rng >= cog._max_downward_range(lobby):
                                         msg += "The floor is already at the bottom for this lobby."
                                     else:
                                         msg += "The floor expands over time, so you might be able to join later."
@@ -215,31 +243,32 @@ async def handle_join(
                                 reply_ephemeral = msg
 
                 if reply_ephemeral is None:
-                    lobby.player_ids.append(user.id)
+                    cog.state.add_players(lobby, [user.id])
 
                     # Store pts snapshot for Elo lobby display
                     if lobby.elo_mode and user_info is not None:
-                        lobby.player_pts[user.id] = float(user_info[0])
+                        lobby.player_pts[user.id] = user_info[0]
+
+                    remaining = lobby.remaining_slots()
 
-                    if lobby.elo_mode and lobby.remaining_slots() == 1 and lobby.almost_full_at is None:
+                    if lobby.elo_mode and remaining == 1 and lobby.almost_full_at is None:
                         lobby.almost_full_at = now_utc()
                         if not cog._is_last_seat_open(lobby):
                             cog._ensure_elo_embed_updater(lobby)
 
                     # If we just became full, start room creation OUTSIDE the lock.
                     if (
-                        lobby.is_full()
+                        remaining == 0
                         and not lobby.has_link()
-                        and not getattr(lobby, "link_creating", False)
+                        and not lobby.link_creating
                     ):
                         lobby.link_creating = True
                         create_room = True
                         create_room_started_at = now_utc()
                         create_room_lobby_id = lobby.lobby_id
-                        _disable_join_button(view)
 
                     embed = cog._build_lobby_embed(guild, lobby)
-                    view._sync_open_last_seat_button()
+                    view._sync_buttons()
                     edit_embed = embed
                     edit_view = view
 
@@ -251,15 +280,17 @@ async def handle_join(
     # Only persist when the join actually succeeded (reply_ephemeral is None
     # AND the lobby was found and is still the view's lobby).
     if reply_ephemeral is None and view.lobby is not None and edit_embed is not None:
-        try:
+        if create_room:
+            # Room creation is about to start: persist link_creating right away.
+            # (_save_lobby_to_db logs its own failures)
             await cog._save_lobby_to_db(view.lobby)
-        except Exception as e:
-            log_error(f"[lfg] Failed to persist lobby after join: {e}")
+        else:
+            cog._mark_lobby_dirty(view.lobby)
 
     if reply_ephemeral is not None:
         # Clear a stale/full lobby if we disabled its view
         if lobby_id_to_clear is not None:
-            async with cog.state.lock:
+            async with cog.state.guild_lock(guild.id):
                 cog._clear_lobby(guild.id, lobby_id_to_clear)
 
         await safe_i_send(interaction, reply_ephemeral, ephemeral=True)
@@ -281,13 +312,13 @@ async def handle_join(
         log_error(f"[lfg] Failed to create SpellTable game: {e}")
 
     # Apply the created link if the lobby is still active + still full
-    async with cog.state.lock:
+    async with cog.state.guild_lock(guild.id):
         lobby = cog.state.peek_guild_lobbies(guild.id).get(create_room_lobby_id)
         if lobby is None:
             return
 
         # If someone left while we were creating, don't finalize
-        if not lobby.is_full() or lobby.has_link() or not getattr(lobby, "link_creating", False):
+        if not lobby.is_full() or lobby.has_link() or not lobby.link_creating:
             lobby.link_creating = False
             return
 
@@ -302,7 +333,10 @@ async def handle_join(
             dms_to_send = list(lobby.player_ids)
             lobby_id_to_clear = lobby.lobby_id
             should_check_high_stakes = True
-            high_stakes_player_ids = list(lobby.player_ids)
+            high_stakes_player_ids = dms_to_send
+
+            # Finalised: drop it from state in the same critical section.
+            cog._clear_lobby(guild.id, lobby_id_to_clear)
 
             with contextlib.suppress(Exception):
                 view.stop()
@@ -315,32 +349,21 @@ async def handle_join(
         )
         return
 
+    dm_members = await warm_ready_members(guild, dms_to_send)
+
     # ✅ Build READY embed (includes pts) OUTSIDE the lock
     ready_embed_for_dm = await cog._build_ready_embed(guild, ready_lobby_ref, create_room_started_at)
 
     # Edit lobby message to READY + remove buttons
     await safe_i_edit(interaction, embed=ready_embed_for_dm, view=None)
 
-    # Remove from store (fast)
-    async with cog.state.lock:
-        cog._clear_lobby(guild.id, lobby_id_to_clear)
-
     # High-stakes announcement (+ logs now in _maybe_announce_high_stakes)
     if should_check_high_stakes and interaction.channel:
         with contextlib.suppress(Exception):
             await cog._maybe_announce_high_stakes(interaction.channel, guild, high_stakes_player_ids)
 
     # DM players
-    for uid in dms_to_send:
-        member = await resolve_member(guild, uid)
-        if not member or member.bot:
-            continue
-        try:
-            await member.send(embed=ready_embed_for_dm)
-        except discord.Forbidden:
-            continue
-        except Exception as e:
-            log_error(f"[lfg] ready DM to {uid} failed: {type(e).__name__}: {e}")
+    await send_ready_dms(guild, dm_members, ready_embed_for_dm)
 
 
 
@@ -375,31 +398,33 @@ async def handle_leave(
     delete_channel_id: Optional[int] = None
     delete_message_id: Optional[int] = None
 
-    async with cog.state.lock:
+    async with cog.state.guild_lock(guild.id):
         lobbies = cog.state.peek_guild_lobbies(guild.id)
         lobby = lobbies.get(view.lobby.lobby_id)
 
         if lobby is None or lobby is not view.lobby:
-            _disable_all_buttons(view)
+            view.disable_all_buttons()
             edit_content = "This lobby is no longer active."
             edit_view = view
         else:
-            if user.id not in lobby.player_ids:
+            if not lobby.has_player(user.id):
                 reply_ephemeral = "You're not in this lobby."
             else:
-                lobby.player_ids = [uid for uid in lobby.player_ids if uid != user.id]
+                cog.state.remove_player(lobby, user.id)
 
                 if lobby.elo_mode:
                     lobby.player_pts.pop(user.id, None)
 
+                remaining = lobby.remaining_slots()
+
                 # If we were creating a room and someone left, allow creation to be triggered again later.
-                if getattr(lobby, "link_creating", False) and not lobby.is_full():
+                if lobby.link_creating and remaining > 0:
                     lobby.link_creating = False
 
-                became_empty = len(lobby.player_ids) == 0
+                became_empty = remaining == lobby.max_seats
 
                 if lobby.elo_mode:
-                    if lobby.remaining_slots() == 1:
+                    if remaining == 1:
                         lobby.almost_full_at = lobby.almost_full_at or now_utc()
                         if not cog._is_last_seat_open(lobby):
                             cog._ensure_elo_embed_updater(lobby)
@@ -424,7 +449,7 @@ async def handle_leave(
                     reply_ephemeral = "You left the lobby. It is now empty and has been closed."
                 else:
                     embed = cog._build_lobby_embed(guild, lobby)
-                    view._sync_open_last_seat_button()
+                    view._sync_buttons()
                     edit_embed = embed
                     edit_view = view
 
@@ -434,17 +459,19 @@ async def handle_leave(
 
     # Persist lobby state after successful leave (if lobby still exists)
     if edit_embed is not None and view.lobby is not None and not delete_message_id:
-        try:
-            await cog._save_lobby_to_db(view.lobby)
-        except Exception as e:
-            log_error(f"[lfg] Failed to persist lobby after leave: {e}")
+        cog._mark_lobby_dirty(view.lobby)
 
-    if delete_channel_id and delete_message_id:
+    async def _delete_lobby_message() -> None:
         channel = guild.get_channel(delete_channel_id)
         if isinstance(channel, discord.TextChannel):
+            # Partial message: one DELETE round-trip, no fetch first
             with contextlib.suppress(Exception):
-                msg = await channel.fetch_message(delete_message_id)
-                await msg.delete()
+                await channel.get_partial_message(delete_message_id).delete()
 
+    outbound = []
+    if delete_channel_id and delete_message_id:
+        outbound.append(_delete_lobby_message())
     if reply_ephemeral:
-        await safe_i_send(interaction, reply_ephemeral, ephemeral=True)
+        outbound.append(safe_i_send(interaction, reply_ephemeral, ephemeral=True))
+    if outbound:
+        await asyncio.gather(*outbound)
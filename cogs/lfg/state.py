@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Dict, Optional
+import itertools
+from typing import Dict, Iterable, Optional, Tuple
 
 from .models import LFGLobby
 
@@ -9,23 +10,34 @@ from .models import LFGLobby
 class LobbyStore:
     """In-memory lobby registry keyed by guild_id and lobby_id.
 
-    Kept intentionally small: just storage + locking + id allocation.
+    Kept intentionally small: just storage + per-guild locking + id allocation.
     All behavioral rules (Elo, timeouts, etc.) live elsewhere.
     """
 
     def __init__(self) -> None:
         self._guild_lobbies: Dict[int, Dict[int, LFGLobby]] = {}
-        self._lock = asyncio.Lock()
-        self._next_lobby_id: int = 1
+        # guild_id -> lock guarding that guild's lobbies and user index entries
+        self._guild_locks: Dict[int, asyncio.Lock] = {}
+        # Monotonic lobby ids; count.__next__ needs no lock on the event loop
+        self._lobby_ids = itertools.count(1)
+        # (guild_id, user_id) -> lobby_id, kept in sync by add/remove helpers below
+        self._user_lobby: Dict[Tuple[int, int], int] = {}
 
-    @property
-    def lock(self) -> asyncio.Lock:
-        return self._lock
+    def guild_lock(self, guild_id: int) -> asyncio.Lock:
+        """Per-guild lock: lobbies in different guilds never contend."""
+        gid = int(guild_id)
+        lock = self._guild_locks.get(gid)
+        if lock is None:
+            lock = self._guild_locks.setdefault(gid, asyncio.Lock())
+        return lock
 
     def alloc_lobby_id(self) -> int:
-        lid = self._next_lobby_id
-        self._next_lobby_id += 1
-        return lid
+        return next(self._lobby_ids)
+
+    def reserve_lobby_id(self, lobby_id: int) -> None:
+        """Make sure alloc_lobby_id never hands out lobby_id (used when rehydrating)."""
+        nxt = next(self._lobby_ids)
+        self._lobby_ids = itertools.count(max(nxt, int(lobby_id) + 1))
 
     def get_guild_lobbies(self, guild_id: int) -> Dict[int, LFGLobby]:
         """Return the mutable lobby dict for a guild (creates if missing)."""
@@ -35,6 +47,40 @@ class LobbyStore:
         """Return the lobby dict for a guild (does not create)."""
         return self._guild_lobbies.get(int(guild_id), {})
 
+    def add_lobby(self, lobby: LFGLobby) -> None:
+        """Register a lobby and index its current players.
+
+        Each guild's dict is kept in created_at order so callers can walk it
+        oldest-first without sorting.
+        """
+        gid = int(lobby.guild_id)
+        lobbies = self.get_guild_lobbies(gid)
+        newest = next(reversed(lobbies.values()), None)
+        lobbies[int(lobby.lobby_id)] = lobby
+        if newest is not None and lobby.created_at < newest.created_at:
+            # Only rehydration inserts out of order; re-sort that one guild.
+            ordered = sorted(lobbies.values(), key=lambda lob: lob.created_at)
+            lobbies.clear()
+            lobbies.update((int(lob.lobby_id), lob) for lob in ordered)
+        for uid in lobby.player_ids:
+            self._user_lobby[(gid, int(uid))] = int(lobby.lobby_id)
+
+    def add_players(self, lobby: LFGLobby, user_ids: Iterable[int]) -> None:
+        """Append players to a lobby, keeping the user -> lobby index in sync."""
+        gid = int(lobby.guild_id)
+        for uid in user_ids:
+            lobby.add_player(uid)
+            self._user_lobby[(gid, int(uid))] = int(lobby.lobby_id)
+
+    def remove_player(self, lobby: LFGLobby, user_id: int) -> None:
+        """Drop a player from a lobby, keeping the user -> lobby index in sync."""
+        uid = int(user_id)
+        lobby.discard_player(uid)
+        lobby.player_lines.pop(uid, None)
+        key = (int(lobby.guild_id), uid)
+        if self._user_lobby.get(key) == int(lobby.lobby_id):
+            del self._user_lobby[key]
+
     def find_user_lobby(
         self,
         guild_id: int,
@@ -42,13 +88,13 @@ class LobbyStore:
         *,
         exclude_lobby_id: Optional[int] = None,
     ) -> Optional[LFGLobby]:
-        lobbies = self._guild_lobbies.get(int(guild_id), {})
-        for lid, lob in lobbies.items():
-            if exclude_lobby_id is not None and lid == exclude_lobby_id:
-                continue
-            if int(user_id) in lob.player_ids:
-                return lob
-        return None
+        lid = self._user_lobby.get((int(guild_id), int(user_id)))
+        if lid is None or lid == exclude_lobby_id:
+            return None
+        lob = self._guild_lobbies.get(int(guild_id), {}).get(lid)
+        if lob is None or not lob.has_player(int(user_id)):
+            return None
+        return lob
 
     def get_lobby(self, guild_id: int, lobby_id: int) -> Optional[LFGLobby]:
         return self._guild_lobbies.get(int(guild_id), {}).get(int(lobby_id))
@@ -64,4 +110,9 @@ class LobbyStore:
         lob = lobbies.pop(int(lobby_id), None)
         if not lobbies:
             self._guild_lobbies.pop(int(guild_id), None)
+        if lob is not None:
+            for uid in lob.player_ids:
+                key = (int(guild_id), int(uid))
+                if self._user_lobby.get(key) == int(lobby_id):
+                    del self._user_lobby[key]
         return lob
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import contextlib
 from typing import Any, Optional
 
 import discord
@@ -8,19 +7,19 @@ import discord
 from .models import LFGLobby
 
 
-def _make_custom_id(base: str, guild_id: int, lobby_id: int) -> str:
-    """Generate a persistent custom_id that encodes guild and lobby."""
-    return f"{base}:{guild_id}:{lobby_id}"
+def _custom_id_suffix(guild_id: int, lobby_id: int) -> str:
+    """Suffix appended to each button's base custom_id to encode guild and lobby."""
+    return f":{guild_id}:{lobby_id}"
 
 
 def _parse_custom_id(custom_id: str) -> Optional[tuple[str, int, int]]:
     """Parse a persistent custom_id. Returns (base, guild_id, lobby_id) or None."""
-    parts = custom_id.split(":")
+    parts = custom_id.split(":", 2)
     if len(parts) != 3:
         return None
     try:
         return (parts[0], int(parts[1]), int(parts[2]))
-    except (ValueError, TypeError):
+    except ValueError:
         return None
 
 
@@ -31,8 +30,8 @@ class LFGJoinView(discord.ui.View):
     
     For persistence across restarts:
     - custom_ids encode guild_id:lobby_id
-    - The cog registers a PersistentLFGView that handles all button clicks
-    - This class is used for creating NEW lobbies (with proper timeout)
+    - On startup the cog rehydrates each stored lobby and re-attaches a fresh
+      instance of this view to its message (see LFGCog rehydration)
     """
 
     def __init__(self, cog: Any, lobby: LFGLobby, *, timeout_seconds: int):
@@ -42,35 +41,67 @@ class LFGJoinView(discord.ui.View):
         self.cog = cog
         self.lobby = lobby
 
+        # Direct refs so toggles don't rescan children (set in _update_custom_ids)
+        self._join_btn: Optional[discord.ui.Button] = None
+        self._leave_btn: Optional[discord.ui.Button] = None
+        self._open_last_seat_btn: Optional[discord.ui.Button] = None
+
         # Update custom_ids to include guild/lobby for persistence
         self._update_custom_ids()
 
         # Hide the last-seat button for non-Elo lobbies
-        if not lobby.elo_mode:
-            for child in list(self.children):
-                if isinstance(child, discord.ui.Button) and "lfg_open_last_seat" in (child.custom_id or ""):
-                    with contextlib.suppress(Exception):
-                        self.remove_item(child)
+        if not lobby.elo_mode and self._open_last_seat_btn is not None:
+            try:
+                self.remove_item(self._open_last_seat_btn)
+            except Exception:
+                pass
+            self._open_last_seat_btn = None
 
-        self._sync_open_last_seat_button()
+        self._sync_buttons()
 
     def _update_custom_ids(self) -> None:
         """Update button custom_ids to encode guild and lobby."""
+        suffix = _custom_id_suffix(self.lobby.guild_id, self.lobby.lobby_id)
         for child in self.children:
             if isinstance(child, discord.ui.Button) and child.custom_id:
-                base = child.custom_id.split(":")[0]  # strip any existing suffix
-                child.custom_id = _make_custom_id(base, self.lobby.guild_id, self.lobby.lobby_id)
+                base = child.custom_id.partition(":")[0]  # strip any existing suffix
+                child.custom_id = base + suffix
+                if base == "lfg_join_button":
+                    self._join_btn = child
+                elif base == "lfg_leave_button":
+                    self._leave_btn = child
+                elif base == "lfg_open_last_seat_button":
+                    self._open_last_seat_btn = child
+
+    def disable_all_buttons(self) -> None:
+        for b in (self._join_btn, self._leave_btn, self._open_last_seat_btn):
+            if b is not None:
+                b.disabled = True
+
+    def _sync_buttons(self) -> None:
+        """Match button states to the lobby; call whenever its embed is rebuilt."""
+        self._sync_join_button()
+        self._sync_open_last_seat_button()
+
+    def _sync_join_button(self) -> None:
+        if self._join_btn is None:
+            return
+        # Re-enabled once a seat frees up (leave, or an aborted room creation)
+        lobby = self.lobby
+        self._join_btn.disabled = lobby.is_full() or lobby.has_link() or lobby.link_creating
 
     def _sync_open_last_seat_button(self) -> None:
-        for child in self.children:
-            if isinstance(child, discord.ui.Button) and child.custom_id and "lfg_open_last_seat" in child.custom_id:
-                child.disabled = not (
-                    self.lobby.elo_mode
-                    and self.lobby.host_elo is not None
-                    and self.lobby.remaining_slots() == 1
-                    and not self.cog._is_last_seat_open(self.lobby)
-                    and not self.lobby.has_link()
-                )
+        if self._open_last_seat_btn is None:
+            return
+        # Cheap, usually-false checks first; the cog call only runs at 3/4 seated
+        lobby = self.lobby
+        self._open_last_seat_btn.disabled = not (
+            lobby.elo_mode
+            and lobby.remaining_slots() == 1
+            and lobby.host_elo is not None
+            and not lobby.has_link()
+            and not self.cog._is_last_seat_open(lobby)
+        )
 
     @discord.ui.button(
         label="Join this game!",
@@ -100,11 +131,7 @@ class LFGJoinView(discord.ui.View):
         await self.cog._handle_open_last_seat(interaction, self, button)
 
     async def on_timeout(self) -> None:
-        guild = self.cog.bot.get_guild(self.lobby.guild_id)
-        if not guild:
-            return
-
-        channel = guild.get_channel(self.lobby.channel_id)
+        channel = self.cog.bot.get_channel(self.lobby.channel_id)
         if not isinstance(channel, discord.TextChannel):
             return
 
@@ -112,16 +139,14 @@ class LFGJoinView(discord.ui.View):
             return
 
         # Clear the in-memory lobby first (fast, under lock), then do Discord I/O.
-        async with self.cog.state.lock:
+        async with self.cog.state.guild_lock(self.lobby.guild_id):
             current = self.cog.state.get_lobby(self.lobby.guild_id, self.lobby.lobby_id)
             if current is None or current is not self.lobby:
                 return
             self.cog._clear_lobby(self.lobby.guild_id, self.lobby.lobby_id)
 
-        try:
-            msg = await channel.fetch_message(self.lobby.message_id)
-        except Exception:
-            return
+        # Partial message: edit by id without fetching it first
+        msg = channel.get_partial_message(self.lobby.message_id)
 
         # Replace the embed+buttons with a plain message
         try:
@@ -130,14 +155,6 @@ class LFGJoinView(discord.ui.View):
                 embeds=[],
                 view=None,
             )
-        except TypeError:
-            # older libs: no 'embeds' kwarg
-            with contextlib.suppress(Exception):
-                await msg.edit(
-                    content="This lobby has expired due to inactivity.",
-                    embed=None,
-                    view=None,
-                )
         except Exception:
             pass
 
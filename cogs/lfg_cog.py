@@ -2,8 +2,9 @@
 import os
 import asyncio
 import contextlib
+import time
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Optional, List, Tuple
+from typing import Any, Dict, Optional, List, Set, Tuple
 
 import discord
 from discord.ext import commands
@@ -29,6 +30,7 @@ from .lfg.embeds import (
     build_ready_embed,
     EloLobbyInfo,
     LastSeatInfo,
+    lobby_embed_key,
 )
 from .lfg.elo import (
     compute_dynamic_window,
@@ -44,6 +46,8 @@ from .lfg.service import (
     handle_join,
     handle_leave,
     handle_open_last_seat,
+    send_ready_dms,
+    warm_ready_members,
 )
 
 from .lfg.autojoin import (
@@ -53,6 +57,7 @@ from .lfg.autojoin import (
 
 from utils.persistence import (
     save_lobby as db_save_lobby,
+    save_lobbies as db_save_lobbies,
     delete_lobby as db_delete_lobby,
     get_all_active_lobbies as db_get_all_active_lobbies,
     cleanup_expired_lobbies as db_cleanup_expired_lobbies,
@@ -66,6 +71,11 @@ LFG_EMBED_ICON_URL = os.getenv("LFG_EMBED_ICON_URL", "").strip()
 # minutes of inactivity (no button clicks) before a lobby auto-expires
 LOBBY_INACTIVITY_MINUTES = int(os.getenv("LOBBY_INACTIVITY_MINUTES", "45"))
 
+# Coalescing window for write-behind lobby saves (seconds)
+LOBBY_SAVE_DEBOUNCE_SECONDS = 0.1
+# Coalescing window for autojoin lobby message edits (seconds); bursts become one edit
+LOBBY_EDIT_DEBOUNCE_SECONDS = 0.25
+
 # TopDeck league config (for Elo lookup)
 FIREBASE_ID_TOKEN = os.getenv("FIREBASE_ID_TOKEN", None)
 
@@ -81,6 +91,8 @@ LFG_ELO_MAX_RANGE = (
 )
 LFG_ELO_EXPAND_INTERVAL_MIN = int(os.getenv("LFG_ELO_EXPAND_INTERVAL_MIN", "5"))  # expand every 5min
 LFG_ELO_MIN_GAMES = int(os.getenv("LFG_ELO_MIN_GAMES", "5"))
+# Per-member (points, games) cache so one /lfg burst doesn't re-resolve the same member
+LFG_ELO_CACHE_SECONDS = int(os.getenv("LFG_ELO_CACHE_SECONDS", "60"))
 
 # ---- dynamic window tuning (percentile-based) -------------------------------
 # At time=0, we aim to allow ~this fraction of rated players to join (via floor).
@@ -120,40 +132,134 @@ class LFGCog(commands.Cog):
         self.state = LobbyStore()
         self._rehydrated = False
         self._persistent_view_registered = False
+        # (bracket_id, user_id) -> ((points, games), cached_at monotonic); misses aren't cached
+        self._player_elo_cache: Dict[Tuple[str, int], Tuple[Tuple[float, int], float]] = {}
+        # Write-behind for non-critical lobby saves: (guild_id, lobby_id) pending a flush
+        self._dirty_lobbies: Set[Tuple[int, int]] = set()
+        self._dirty_flush_task: Optional[asyncio.Task] = None
+        # In-flight bulk upsert; lobby deletes wait for it so they always land last
+        self._bulk_save: Optional[asyncio.Future] = None
+        # Debounced lobby message refreshes: (guild_id, lobby_id) pending an edit
+        self._pending_edits: Set[Tuple[int, int]] = set()
+        self._edit_flush_task: Optional[asyncio.Task] = None
+
+    def cog_unload(self):
+        # Stop the debounce loops, then send any queued saves right away
+        for task in (self._dirty_flush_task, self._edit_flush_task):
+            if task is not None and not task.done():
+                task.cancel()
+        self._pending_edits.clear()
+        if self._dirty_lobbies:
+            self._dirty_flush_task = asyncio.create_task(self._save_dirty_lobbies())
 
     # ---------- Persistence helpers ----------
 
+    def _lobby_db_fields(self, lobby: LFGLobby) -> Dict[str, Any]:
+        """Snapshot the persisted lobby fields (and a fresh expiry) for save_lobby(s)."""
+        return dict(
+            guild_id=lobby.guild_id,
+            lobby_id=lobby.lobby_id,
+            channel_id=lobby.channel_id,
+            message_id=lobby.message_id,
+            host_id=lobby.host_id,
+            player_ids=lobby.player_ids,
+            invited_ids=lobby.invited_ids,
+            max_seats=lobby.max_seats,
+            link=lobby.link,
+            link_creating=lobby.link_creating,
+            elo_mode=lobby.elo_mode,
+            host_elo=lobby.host_elo,
+            elo_base_range=lobby.elo_base_range,
+            elo_range_step=lobby.elo_range_step,
+            elo_max_steps=lobby.elo_max_steps,
+            player_pts=lobby.player_pts,
+            created_at=lobby.created_at,
+            almost_full_at=lobby.almost_full_at,
+            last_seat_open=lobby.last_seat_open,
+            expires_at=now_utc() + timedelta(minutes=LOBBY_INACTIVITY_MINUTES),
+        )
+
     async def _save_lobby_to_db(self, lobby: LFGLobby) -> None:
         """Persist the current lobby state to MongoDB."""
         try:
-            expires_at = now_utc() + timedelta(minutes=LOBBY_INACTIVITY_MINUTES)
-            await db_save_lobby(
-                guild_id=lobby.guild_id,
-                lobby_id=lobby.lobby_id,
-                channel_id=lobby.channel_id,
-                message_id=lobby.message_id,
-                host_id=lobby.host_id,
-                player_ids=lobby.player_ids,
-                invited_ids=lobby.invited_ids,
-                max_seats=lobby.max_seats,
-                link=lobby.link,
-                link_creating=lobby.link_creating,
-                elo_mode=lobby.elo_mode,
-                host_elo=lobby.host_elo,
-                elo_base_range=lobby.elo_base_range,
-                elo_range_step=lobby.elo_range_step,
-                elo_max_steps=lobby.elo_max_steps,
-                player_pts=lobby.player_pts,
-                created_at=lobby.created_at,
-                almost_full_at=lobby.almost_full_at,
-                last_seat_open=lobby.last_seat_open,
-                expires_at=expires_at,
-            )
+            await db_save_lobby(**self._lobby_db_fields(lobby))
         except Exception as e:
             log_error(f"[lfg] Failed to persist lobby {lobby.guild_id}:{lobby.lobby_id}: {type(e).__name__}: {e}")
 
+    def _mark_lobby_dirty(self, lobby: LFGLobby) -> None:
+        """Queue a lobby save; repeated marks within the flush window coalesce."""
+        self._dirty_lobbies.add((lobby.guild_id, lobby.lobby_id))
+        if self._dirty_flush_task is None or self._dirty_flush_task.done():
+            self._dirty_flush_task = asyncio.create_task(self._flush_dirty_lobbies())
+
+    async def _flush_dirty_lobbies(self) -> None:
+        """Persist queued lobbies, one bulk write per debounce window."""
+        while self._dirty_lobbies:
+            await asyncio.sleep(LOBBY_SAVE_DEBOUNCE_SECONDS)
+            await self._save_dirty_lobbies()
+
+    async def _save_dirty_lobbies(self) -> None:
+        """Bulk-save every queued lobby that is still in memory."""
+        keys, self._dirty_lobbies = self._dirty_lobbies, set()
+        batch: List[Dict[str, Any]] = []
+        for guild_id, lobby_id in keys:
+            lobby = self.state.get_lobby(guild_id, lobby_id)
+            if lobby is None:
+                continue  # cleared meanwhile; _clear_lobby handles the DB delete
+            batch.append(self._lobby_db_fields(lobby))
+        if not batch:
+            return
+        # Shielded: cancelling the flush loop must not abort a write already sent
+        self._bulk_save = asyncio.ensure_future(db_save_lobbies(batch))
+        try:
+            await asyncio.shield(self._bulk_save)
+        except Exception as e:
+            log_error(f"[lfg] Failed to persist {len(batch)} lobbies: {type(e).__name__}: {e}")
+
+    def _schedule_lobby_edit(self, lobby: LFGLobby) -> None:
+        """Queue a lobby message refresh; marks within the edit window coalesce."""
+        self._pending_edits.add((lobby.guild_id, lobby.lobby_id))
+        if self._edit_flush_task is None or self._edit_flush_task.done():
+            self._edit_flush_task = asyncio.create_task(self._flush_lobby_edits())
+
+    async def _flush_lobby_edits(self) -> None:
+        """Re-render every queued lobby that is still open, one edit each."""
+        while self._pending_edits:
+            await asyncio.sleep(LOBBY_EDIT_DEBOUNCE_SECONDS)
+            keys, self._pending_edits = self._pending_edits, set()
+            for guild_id, lobby_id in keys:
+                lobby = self.state.get_lobby(guild_id, lobby_id)
+                # Cleared, or finalising (the ready path owns the message then)
+                if lobby is None or not self._is_lobby_active(lobby):
+                    continue
+                guild = self.bot.get_guild(guild_id)
+                channel = guild.get_channel(lobby.channel_id) if guild else None
+                if not isinstance(channel, discord.TextChannel) or not lobby.message_id or not lobby.view:
+                    continue
+                prev_key = lobby.embed_key
+                embed = self._build_lobby_embed(guild, lobby)
+                lobby.view._sync_buttons()
+                key = lobby_embed_key(embed, lobby.view)
+                if key == prev_key:
+                    # Marks that net out (join then leave) leave the message as-is
+                    lobby.embed_key = prev_key
+                    continue
+                msg = lobby.message or channel.get_partial_message(lobby.message_id)
+                try:
+                    await msg.edit(embed=embed, view=lobby.view)
+                    lobby.embed_key = key
+                except discord.HTTPException:
+                    lobby.message = None
+                except Exception:
+                    pass
+
     async def _delete_lobby_from_db(self, guild_id: int, lobby_id: int) -> None:
         """Delete lobby from DB (used by _clear_lobby)."""
+        # A bulk upsert already sent may still carry this lobby; delete after it lands
+        pending = self._bulk_save
+        if pending is not None and not pending.done():
+            with contextlib.suppress(Exception):
+                await asyncio.shield(pending)
         try:
             await db_delete_lobby(guild_id, lobby_id)
         except Exception as e:
@@ -272,6 +378,7 @@ class LFGCog(commands.Cog):
         lobby.lobby_id = lobby_id
         lobby.player_ids = [int(x) for x in (doc.get("player_ids") or [])]
         lobby.message_id = int(message_id)
+        lobby.message = msg
         lobby.link = str(doc.get("link") or "")
         lobby.link_creating = bool(doc.get("link_creating", False))
         
@@ -318,19 +425,17 @@ class LFGCog(commands.Cog):
         view = LFGJoinView(self, lobby, timeout_seconds=LOBBY_INACTIVITY_MINUTES * 60)
         lobby.view = view
 
-        # Update max lobby_id counter
-        async with self.state.lock:
-            current_max = self.state._next_lobby_id
-            if lobby_id >= current_max:
-                self.state._next_lobby_id = lobby_id + 1
+        # Keep newly allocated ids above every rehydrated one
+        self.state.reserve_lobby_id(lobby_id)
 
-            # Add to in-memory state
-            self._get_guild_lobbies(guild_id)[lobby_id] = lobby
+        # Add to in-memory state
+        async with self.state.guild_lock(guild_id):
+            self.state.add_lobby(lobby)
 
         # Re-attach the view to the existing message
         try:
             embed = self._build_lobby_embed(guild, lobby)
-            view._sync_open_last_seat_button()
+            view._sync_buttons()
             await msg.edit(embed=embed, view=view)
         except Exception as e:
             log_warn(f"[lfg] Rehydrate: failed to update message view: {type(e).__name__}: {e}")
@@ -374,18 +479,25 @@ class LFGCog(commands.Cog):
         asyncio.create_task(self._delete_lobby_from_db(guild_id, lobby_id))
 
     def _is_lobby_active(self, lobby: LFGLobby) -> bool:
-        return self.state.is_lobby_active(lobby) and not lobby.has_link() and not getattr(lobby, "link_creating", False)
+        return self.state.is_lobby_active(lobby) and not lobby.has_link() and not lobby.link_creating
 
     def _ensure_elo_embed_updater(self, lobby: LFGLobby) -> None:
         if not lobby.elo_mode:
             return
-        if not self._is_lobby_active(lobby):
-            return
+        # Already running: reuse it (join/leave call this on every 3/4 transition)
         if lobby.update_task is not None and not lobby.update_task.done():
             return
-        if lobby.update_task is not None and lobby.update_task.done():
-            lobby.update_task = None
-        lobby.update_task = asyncio.create_task(self._run_elo_embed_updater(lobby))
+        if not self._is_lobby_active(lobby):
+            return
+        task = asyncio.create_task(self._run_elo_embed_updater(lobby))
+        lobby.update_task = task
+
+        def _release(t: asyncio.Task) -> None:
+            # Drop the finished task so the lobby doesn't pin its frame/result
+            if lobby.update_task is t:
+                lobby.update_task = None
+
+        task.add_done_callback(_release)
 
     async def _compute_dynamic_window(self, host_elo: float) -> Tuple[int, int]:
         bracket_id = await get_bracket_id()
@@ -521,16 +633,25 @@ class LFGCog(commands.Cog):
                 if not lobby.message_id or not lobby.view:
                     continue
 
-                try:
-                    msg = await channel.fetch_message(lobby.message_id)
-                except Exception:
-                    break
-
+                prev_key = lobby.embed_key
                 embed = self._build_lobby_embed(guild, lobby)
-                lobby.view._sync_open_last_seat_button()
+                lobby.view._sync_buttons()
+                key = lobby_embed_key(embed, lobby.view)
+                if key == prev_key:
+                    # Nothing visible changed since our last push; skip the API calls
+                    lobby.embed_key = prev_key
+                    continue
 
-                with contextlib.suppress(Exception):
+                msg = lobby.message or channel.get_partial_message(lobby.message_id)
+                try:
                     await msg.edit(embed=embed, view=lobby.view)
+                    lobby.embed_key = key
+                except discord.NotFound:
+                    break  # message deleted; nothing left to keep fresh
+                except discord.HTTPException:
+                    lobby.message = None
+                except Exception:
+                    pass
 
         except asyncio.CancelledError:
             return
@@ -585,10 +706,20 @@ class LFGCog(commands.Cog):
 
         Matching is done by normalizing the member's username/global_name/display_name
         and comparing to TopDeck's stored discord handle (normalized).
+
+        Hits are memoised for LFG_ELO_CACHE_SECONDS; a miss (not linked / not
+        ranked) is always re-resolved so a freshly linked player isn't locked out.
         """
         bracket_id = await get_bracket_id()
         if not bracket_id:
             return None
+
+        key = (bracket_id, int(member.id))
+        now = time.monotonic()
+        cached = self._player_elo_cache.get(key)
+        if cached is not None and now - cached[1] < LFG_ELO_CACHE_SECONDS:
+            return cached[0]
+
         info = await get_member_points_games(
             member,
             bracket_id=bracket_id,
@@ -598,9 +729,20 @@ class LFGCog(commands.Cog):
         if info is None:
             return None
         pts, games = info
-        return float(pts), int(games)
+        result = (float(pts), int(games))
+
+        # Drop expired entries before growing the cache
+        if len(self._player_elo_cache) >= 4096:
+            self._player_elo_cache = {
+                k: v for k, v in self._player_elo_cache.items()
+                if now - v[1] < LFG_ELO_CACHE_SECONDS
+            }
+        self._player_elo_cache[key] = (result, now)
+        return result
 
     def _build_lobby_embed(self, guild: discord.Guild, lobby: LFGLobby) -> discord.Embed:
+        # Any rebuild may be pushed by another path, so the updater's fingerprint is stale
+        lobby.embed_key = None
         elo_info: Optional[EloLobbyInfo] = None
 
         if lobby.elo_mode and lobby.host_elo is not None:
@@ -738,7 +880,7 @@ class LFGCog(commands.Cog):
             return
 
         already_in_lobby = False
-        async with self.state.lock:
+        async with self.state.guild_lock(ctx.guild.id):
             already_in_lobby = self._find_user_lobby(ctx.guild.id, ctx.author.id) is not None
 
         if already_in_lobby:
@@ -773,7 +915,7 @@ class LFGCog(commands.Cog):
         full_lobby: Optional[LFGLobby] = None
         lobby: Optional[LFGLobby] = None
 
-        async with self.state.lock:
+        async with self.state.guild_lock(ctx.guild.id):
             lobby = LFGLobby(
                 guild_id=ctx.guild.id,
                 channel_id=ctx.channel.id,
@@ -787,18 +929,18 @@ class LFGCog(commands.Cog):
             lobby.lobby_id = self._alloc_lobby_id()
 
             for uid in invited_ids:
-                if len(lobby.player_ids) >= lobby.max_seats:
+                if lobby.is_full():
                     break
-                if uid in lobby.player_ids:
+                if lobby.has_player(uid):
                     continue
                 if self._find_user_lobby(ctx.guild.id, uid) is not None:
                     continue
-                lobby.player_ids.append(uid)
+                lobby.add_player(uid)
 
             if lobby.is_full():
                 full_lobby = lobby
             else:
-                self._get_guild_lobbies(ctx.guild.id)[lobby.lobby_id] = lobby
+                self.state.add_lobby(lobby)
 
         if full_lobby is not None:
             try:
@@ -820,6 +962,7 @@ class LFGCog(commands.Cog):
             full_lobby.link = link
 
             started_at = now_utc()
+            dm_members = await warm_ready_members(ctx.guild, full_lobby.player_ids)
             ready_embed = await self._build_ready_embed(ctx.guild, full_lobby, started_at)
 
             msg = await safe_ctx_followup(ctx, embed=ready_embed)
@@ -827,16 +970,7 @@ class LFGCog(commands.Cog):
             with contextlib.suppress(Exception):
                 await self._maybe_announce_high_stakes(msg.channel, ctx.guild, full_lobby.player_ids)
 
-            for uid in full_lobby.player_ids:
-                member = await resolve_member(ctx.guild, uid)
-                if not member or member.bot:
-                    continue
-                try:
-                    await member.send(embed=ready_embed)
-                except discord.Forbidden:
-                    continue
-                except Exception as e:
-                    log_error(f"[lfg] ready DM to {uid} failed: {type(e).__name__}: {e}")
+            await send_ready_dms(ctx.guild, dm_members, ready_embed)
 
             return
 
@@ -881,7 +1015,7 @@ class LFGCog(commands.Cog):
             return
 
         already_in_lobby = False
-        async with self.state.lock:
+        async with self.state.guild_lock(ctx.guild.id):
             already_in_lobby = self._find_user_lobby(ctx.guild.id, ctx.author.id) is not None
 
         if already_in_lobby:
@@ -925,7 +1059,7 @@ class LFGCog(commands.Cog):
         base_range, range_step = await self._compute_dynamic_window(host_elo)
 
         lobby: Optional[LFGLobby] = None
-        async with self.state.lock:
+        async with self.state.guild_lock(ctx.guild.id):
             lobby = LFGLobby(
                 guild_id=ctx.guild.id,
                 channel_id=ctx.channel.id,
@@ -940,7 +1074,7 @@ class LFGCog(commands.Cog):
             lobby.elo_range_step = int(range_step)
 
             lobby.lobby_id = self._alloc_lobby_id()
-            self._get_guild_lobbies(ctx.guild.id)[lobby.lobby_id] = lobby
+            self.state.add_lobby(lobby)
 
         if lobby is None:
             await safe_ctx_followup(ctx, "Something went wrong creating the Elo lobby.", ephemeral=True)
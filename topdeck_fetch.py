@@ -517,6 +517,9 @@ def _get_cache_lock() -> asyncio.Lock:
 # handle -> (pts, games) choosing the *best* row per handle
 _TOPDECK_HANDLE_BEST_CACHE: Dict[Tuple[str, str], Tuple[Dict[str, Tuple[float, int]], datetime]] = {}
 
+# rows with games > 0 (get_league_rows_cached(active_only=True))
+_TOPDECK_ACTIVE_ROWS_CACHE: Dict[Tuple[str, str], Tuple[List[PlayerRow], datetime]] = {}
+
 _TOPDECK_CACHE: Dict[Tuple[str, str], Tuple[List[PlayerRow], datetime]] = {}
 _TOPDECK_CACHE_TTL = timedelta(minutes=TOPDECK_CACHE_MINUTES)
 
@@ -660,6 +663,7 @@ async def get_league_rows_cached(
     firebase_id_token: Optional[str] = None,
     *,
     force_refresh: bool = False,
+    active_only: bool = False,
 ) -> Tuple[List[PlayerRow], datetime]:
     """
     Cached wrapper around get_league_rows.
@@ -667,6 +671,7 @@ async def get_league_rows_cached(
     - Respects TOPDECK_CACHE_MINUTES env var.
     - Cache key is (bracket_id, firebase_id_token or '').
     - Returns (rows, fetched_at).
+    - active_only=True returns only rows with games > 0 (filtered once per fetch).
     - Also caches matches for treasure pod result checking.
     """
     if not bracket_id:
@@ -674,6 +679,17 @@ async def get_league_rows_cached(
 
     key = (bracket_id, firebase_id_token or "")
 
+    if active_only:
+        rows, fetched_at = await get_league_rows_cached(
+            bracket_id, firebase_id_token, force_refresh=force_refresh
+        )
+        cached = _TOPDECK_ACTIVE_ROWS_CACHE.get(key)
+        if cached is not None and cached[1] == fetched_at:
+            return cached
+        active = [r for r in rows if r.games > 0]
+        _TOPDECK_ACTIVE_ROWS_CACHE[key] = (active, fetched_at)
+        return active, fetched_at
+
     async with _get_cache_lock():
         now = datetime.now(timezone.utc)
 
@@ -711,6 +727,7 @@ async def get_league_rows_cached(
 
         # Invalidate derived caches for this key
         _TOPDECK_HANDLE_BEST_CACHE.pop(key, None)
+        _TOPDECK_ACTIVE_ROWS_CACHE.pop(key, None)
 
         return rows, now
 
@@ -38,10 +38,21 @@ def _apply_dark_style(ax, fig):
     ax.grid(True, color=GRID, alpha=0.5, linestyle="--", linewidth=0.5)
 
 
-def _save(fig) -> io.BytesIO:
-    """Save figure to BytesIO PNG and close."""
+def _save(fig, *, fast: bool = False) -> io.BytesIO:
+    """Save figure to BytesIO PNG and close.
+
+    fast=True uses zlib level 1: much cheaper to encode for flat-colour
+    charts, at the cost of a slightly larger file.
+    """
     buf = io.BytesIO()
-    fig.savefig(buf, format="png", dpi=150, bbox_inches="tight", facecolor=fig.get_facecolor())
+    fig.savefig(
+        buf,
+        format="png",
+        dpi=150,
+        bbox_inches="tight",
+        facecolor=fig.get_facecolor(),
+        pil_kwargs={"compress_level": 1} if fast else None,
+    )
     buf.seek(0)
     plt.close(fig)
     return buf
@@ -307,7 +318,7 @@ def render_league_activity(
     ax.legend(loc="upper right", facecolor=BG, edgecolor=GRID, labelcolor=FG)
     ax.set_title(f"ECL League Activity ({month_label})", fontsize=13, color=FG, pad=12)
 
-    return _save(fig)
+    return _save(fig, fast=True)
 
 
 def render_league_standings(
@@ -329,7 +340,7 @@ def render_league_standings(
 
     ax.set_title(f"ECL Standings \u2014 Top {len(names)} ({month_label})", fontsize=13, color=FG, pad=12)
 
-    return _save(fig)
+    return _save(fig, fast=True)
 
 
 def render_league_points_distribution(
@@ -349,7 +360,7 @@ def render_league_points_distribution(
 
     ax.set_title(f"ECL Points Distribution ({month_label})", fontsize=13, color=FG, pad=12)
 
-    return _save(fig)
+    return _save(fig, fast=True)
 
 
 def render_league_games_distribution(
@@ -369,7 +380,7 @@ def render_league_games_distribution(
 
     ax.set_title(f"ECL Games Distribution ({month_label})", fontsize=13, color=FG, pad=12)
 
-    return _save(fig)
+    return _save(fig, fast=True)
 
 
 # ---------------------------------------------------------------------------
@@ -395,7 +406,7 @@ def render_league_activity_alltime(
 
     ax.set_title("ECL League Activity \u2014 All Time", fontsize=13, color=FG, pad=12)
 
-    return _save(fig)
+    return _save(fig, fast=True)
 
 
 def render_league_activity_daily_avg(
@@ -416,7 +427,7 @@ def render_league_activity_daily_avg(
 
     ax.set_title("ECL Avg Games by Day of Month \u2014 All Time", fontsize=13, color=FG, pad=12)
 
-    return _save(fig)
+    return _save(fig, fast=True)
 
 
 def render_league_participation_alltime(
@@ -438,7 +449,7 @@ def render_league_participation_alltime(
 
     ax.set_title("ECL Participation \u2014 All Time", fontsize=13, color=FG, pad=12)
 
-    return _save(fig)
+    return _save(fig, fast=True)
 
 
 def render_league_points_alltime(
@@ -464,7 +475,7 @@ def render_league_points_alltime(
     ax.legend(loc="upper left", facecolor=BG, edgecolor=GRID, labelcolor=FG)
     ax.set_title("ECL Points Spread \u2014 All Time", fontsize=13, color=FG, pad=12)
 
-    return _save(fig)
+    return _save(fig, fast=True)
 
 
 def render_turn_order_winrates(
@@ -505,7 +516,7 @@ def render_turn_order_winrates(
 
     ax.set_title(title, fontsize=13, color=FG, pad=12)
 
-    return _save(fig)
+    return _save(fig, fast=True)
 
 
 def render_player_stats_card(
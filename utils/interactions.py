@@ -15,7 +15,7 @@ Supports:
 from __future__ import annotations
 
 import contextlib
-from typing import Optional, Union
+from typing import Iterable, List, Optional, Union
 
 import discord
 
@@ -145,3 +145,19 @@ async def resolve_member(
         return await guild.fetch_member(uid)
     except Exception:
         return None
+
+
+async def resolve_members(
+    guild: discord.Guild,
+    user_ids: Iterable[int],
+) -> List[discord.Member]:
+    """Cache first, then one gateway query for every miss. Order follows user_ids."""
+    ids = [int(u) for u in user_ids]
+    found = {uid: m for uid in ids if (m := guild.get_member(uid)) is not None}
+    missing = [uid for uid in ids if uid not in found]
+    if missing:
+        with contextlib.suppress(Exception):
+            fetched = await guild.query_members(user_ids=missing, limit=len(missing), cache=True)
+            for m in fetched:
+                found[int(m.id)] = m
+    return [found[uid] for uid in ids if uid in found]
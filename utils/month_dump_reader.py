@@ -22,6 +22,8 @@ from collections import OrderedDict, defaultdict
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
 from db import topdeck_month_dump_runs, topdeck_month_dump_chunks, topdeck_pods
 from topdeck_fetch import (
     Match,
@@ -940,13 +942,16 @@ async def get_league_monthly_aggregates(
 
 def get_league_daily_activity(
     matches: List[Match],
-) -> Dict[int, Dict[str, int]]:
+) -> np.ndarray:
     """Bucket league-wide game outcomes by day-of-month. Each match = 1 game.
 
     A completed match is counted as 1 win, 1 loss, or 1 draw (per game, not per player).
     Only completed matches are counted.
+
+    Returns an int32 array of shape (3, max_day + 1) with rows
+    (wins, losses, draws); column 0 is unused so ``arr[:, day]`` is that day.
     """
-    daily: Dict[int, Dict[str, int]] = {}
+    arr = np.zeros((3, 32), dtype=np.int32)
     counted = 0
 
     for m in matches:
@@ -957,23 +962,21 @@ def get_league_daily_activity(
         if ts is None:
             continue
 
-        dt = datetime.fromtimestamp(ts, tz=timezone.utc).astimezone(LISBON_TZ)
-        day = dt.day
-
-        if day not in daily:
-            daily[day] = {"wins": 0, "losses": 0, "draws": 0}
-
+        day = datetime.fromtimestamp(ts, tz=timezone.utc).astimezone(LISBON_TZ).day
         counted += 1
 
         if m.winner == "_DRAW_":
-            daily[day]["draws"] += 1
+            arr[2, day] += 1
         elif m.winner is not None:
             # One game = 1 win (the winner's game) — count the game once
-            daily[day]["wins"] += 1
+            arr[0, day] += 1
+
+    active = np.flatnonzero(arr.any(axis=0))
+    max_day = int(active[-1]) if active.size else 0
 
     log_sync(f"[graphs] get_league_daily_activity: {counted} completed matches, "
-             f"{len(daily)} days with games")
-    return daily
+             f"{active.size} days with games")
+    return arr[:, : max_day + 1]
 
 
 async def get_league_avg_daily_activity(
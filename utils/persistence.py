@@ -10,7 +10,9 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Dict, List, Optional, Tuple, TypedDict
+
+from pymongo import UpdateOne
 
 from db import persistent_timers, persistent_lobbies
 
@@ -206,7 +208,7 @@ class LobbyDoc(TypedDict, total=False):
     updated_at: datetime
 
 
-async def save_lobby(
+def _lobby_upsert(
     guild_id: int,
     lobby_id: int,
     channel_id: int,
@@ -227,8 +229,8 @@ async def save_lobby(
     almost_full_at: Optional[datetime],
     last_seat_open: bool,
     expires_at: datetime,
-) -> None:
-    """Upsert a lobby document."""
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Build the (filter, update) pair that upserts a lobby document."""
     now = _now_utc()
     
     # Convert player_pts keys to strings (MongoDB requirement)
@@ -257,13 +259,25 @@ async def save_lobby(
         "updated_at": now,
     }
 
-    await persistent_lobbies.update_one(
+    return (
         {"guild_id": int(guild_id), "lobby_id": int(lobby_id)},
         {"$set": doc, "$setOnInsert": {"created_at": created_at}},
-        upsert=True,
     )
 
 
+async def save_lobby(**fields: Any) -> None:
+    """Upsert a lobby document (fields as in _lobby_upsert)."""
+    flt, update = _lobby_upsert(**fields)
+    await persistent_lobbies.update_one(flt, update, upsert=True)
+
+
+async def save_lobbies(lobbies: List[Dict[str, Any]]) -> None:
+    """Upsert several lobby documents in one unordered bulk write."""
+    ops = [UpdateOne(*_lobby_upsert(**fields), upsert=True) for fields in lobbies]
+    if ops:
+        await persistent_lobbies.bulk_write(ops, ordered=False)
+
+
 async def delete_lobby(guild_id: int, lobby_id: int) -> None:
     """Remove a lobby document."""
     await persistent_lobbies.delete_one({
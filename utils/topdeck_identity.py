@@ -29,6 +29,9 @@ CONF_AMBIG_HANDLE = "ambiguous_handle"
 CONF_AMBIG_NAME = "ambiguous_name"
 CONF_NONE = "none"
 
+_MENTION_RE = re.compile(r"<@!?(\d{15,25})>")
+_DIGITS_RE = re.compile(r"\b(\d{15,25})\b")
+
 
 @dataclass(frozen=True)
 class MemberIndex:
@@ -65,11 +68,12 @@ def extract_discord_id(text: str) -> Optional[int]:
         return None
     t = str(text).strip()
 
-    m = re.search(r"<@!?(\d{15,25})>", t)
-    if m:
-        return int(m.group(1))
+    if "<@" in t:
+        m = _MENTION_RE.search(t)
+        if m:
+            return int(m.group(1))
 
-    m2 = re.search(r"\b(\d{15,25})\b", t)
+    m2 = _DIGITS_RE.search(t)
     if m2:
         return int(m2.group(1))
 
@@ -96,8 +100,6 @@ def member_handle_candidates(member: discord.Member) -> List[str]:
     Priority: username (@handle) first, then global_name, then display_name.
     Username is what players typically enter in TopDeck.
     """
-    cands: List[str] = []
-
     ordered = [
         getattr(member, "name", None),          # Username (@handle) - stable, unique
         getattr(member, "global_name", None),   # Global display name
@@ -109,14 +111,11 @@ def member_handle_candidates(member: discord.Member) -> List[str]:
     if discrim and discrim != "0" and getattr(member, "name", None):
         ordered.append(f"{member.name}#{discrim}")
 
-    for raw in ordered:
-        if not raw:
-            continue
-        h = normalize_topdeck_discord(str(raw))
-        if h and h not in cands:
-            cands.append(h)
-
-    return cands
+    # Dedupe raw strings first (name/global_name/display_name often coincide) so
+    # each distinct one is normalized once, then dedupe the normalized handles.
+    raws = dict.fromkeys(str(raw) for raw in ordered if raw)
+    cands = dict.fromkeys(h for h in map(normalize_topdeck_discord, raws) if h)
+    return list(cands)
 
 
 def _member_name_candidates(member: discord.Member) -> List[str]: